@@ -1,3 +1,4 @@
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
@@ -23,17 +24,28 @@ class Settings:
     REPORT_DIR = Path("reports")
     SCREENSHOT_DIR = REPORT_DIR / "screenshots"
     LOG_DIR = REPORT_DIR / "logs"
+    LOG_LEVEL = os.getenv("GPUAS_LOG_LEVEL", "INFO").upper()
 
     # Performance
     LOAD_TEST_USERS = int(os.getenv("LOAD_TEST_USERS", 10))
     LOAD_TEST_DURATION = os.getenv("LOAD_TEST_DURATION", "30s")
 
+    _dirs_created = False
+
     def __init__(self):
-        # Create directories if they don't exist
-        self.REPORT_DIR.mkdir(exist_ok=True)
-        self.SCREENSHOT_DIR.mkdir(exist_ok=True)
-        self.LOG_DIR.mkdir(exist_ok=True)
+        # Create directories once per process
+        if Settings._dirs_created:
+            return
+        for directory in (self.REPORT_DIR, self.SCREENSHOT_DIR, self.LOG_DIR):
+            directory.mkdir(parents=True, exist_ok=True)
+        Settings._dirs_created = True
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance"""
+    return Settings()
 
 
-auth_settings = Settings()
+auth_settings = get_settings()
 settings = auth_settings
@@ -1,39 +1,89 @@
-import factory
-from factory import Faker
+"""
+Test data factories.
 
+factory_boy is only imported the first time a factory is accessed, so
+modules that never build test data don't pay for it during collection.
+Random fields draw from module-level tuples via the stdlib ``random``
+module rather than going through Faker providers on every build; seed
+``random`` for reproducible data.
 
-class GPUInstanceFactory(factory.Factory):
-    """Factory for creating GPU instance test data"""
+The named variants (``create_training_instance`` and friends) take no
+random inputs, so each is built once and callers get a shallow copy.
+"""
 
-    class Meta:
-        model = dict
+import functools
+import random
 
-    gpu_type = Faker("random_element", elements=["A100", "H100", "V100", "RTX4090"])
-    count = Faker("random_int", min=1, max=8)
-    region = Faker("random_element", elements=["us-east-1", "eu-west-1", "ap-south-1"])
+_FACTORY_NAMES = ("GPUInstanceFactory", "JobFactory")
+_factories = {}
 
-    @classmethod
-    def create_training_instance(cls):
-        """Create instance optimized for training workloads"""
-        return cls.build(gpu_type="A100", count=4, region="us-east-1")
+_GPU_TYPES = ("A100", "H100", "V100", "RTX4090")
+_REGIONS = ("us-east-1", "eu-west-1", "ap-south-1")
+_JOB_TYPES = ("training", "inference", "fine-tuning")
 
-    @classmethod
-    def create_inference_instance(cls):
-        """Create instance optimized for inference workloads"""
-        return cls.build(gpu_type="H100", count=2, region="ap-south-1")
 
+def _memoized_variant(build):
+    """Build a fixed-field variant once per factory class, returning a fresh copy per call."""
+    cached = functools.lru_cache(maxsize=None)(build)
 
-class JobFactory(factory.Factory):
-    """Factory for creating job test data"""
+    @functools.wraps(build)
+    def variant(cls):
+        return dict(cached(cls))
 
-    class Meta:
-        model = dict
+    return variant
 
-    job_type = Faker("random_element", elements=["training", "inference", "fine-tuning"])
-    duration = Faker("random_int", min=300, max=3600)  # 5 min to 1 hour
-    dataset_size = Faker("random_int", min=100, max=10000)  # MB
 
-    @classmethod
-    def create_long_running_job(cls):
-        """Create a long-running training job"""
-        return cls.build(job_type="training", duration=7200, dataset_size=5000)
+def _build_factories():
+    import factory
+
+    class GPUInstanceFactory(factory.Factory):
+        """Factory for creating GPU instance test data"""
+
+        class Meta:
+            model = dict
+
+        gpu_type = factory.LazyFunction(lambda: random.choice(_GPU_TYPES))
+        count = factory.LazyFunction(lambda: random.randint(1, 8))
+        region = factory.LazyFunction(lambda: random.choice(_REGIONS))
+
+        @classmethod
+        @_memoized_variant
+        def create_training_instance(cls):
+            """Create instance optimized for training workloads"""
+            return cls.build(gpu_type="A100", count=4, region="us-east-1")
+
+        @classmethod
+        @_memoized_variant
+        def create_inference_instance(cls):
+            """Create instance optimized for inference workloads"""
+            return cls.build(gpu_type="H100", count=2, region="ap-south-1")
+
+    class JobFactory(factory.Factory):
+        """Factory for creating job test data"""
+
+        class Meta:
+            model = dict
+
+        job_type = factory.LazyFunction(lambda: random.choice(_JOB_TYPES))
+        duration = factory.LazyFunction(lambda: random.randint(300, 3600))  # 5 min to 1 hour
+        dataset_size = factory.LazyFunction(lambda: random.randint(100, 10000))  # MB
+
+        @classmethod
+        @_memoized_variant
+        def create_long_running_job(cls):
+            """Create a long-running training job"""
+            return cls.build(job_type="training", duration=7200, dataset_size=5000)
+
+    _factories.update(GPUInstanceFactory=GPUInstanceFactory, JobFactory=JobFactory)
+
+
+def __getattr__(name):
+    if name in _FACTORY_NAMES:
+        if not _factories:
+            _build_factories()
+        return _factories[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_FACTORY_NAMES))
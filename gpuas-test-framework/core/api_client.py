@@ -1,29 +1,108 @@
+import asyncio
 import json
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Iterator, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from config.settings import settings
 from utils.logger import logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 
 class APIError(Exception):
     """Custom exception for API errors"""
 
 
+# (connect, read) timeouts applied to every request
+_TIMEOUT = (settings.WAIT_TIMEOUT, settings.TEST_TIMEOUT)
+
+# Longest server-side wait requested by a single long-poll read
+_LONG_POLL_MAX = 30
+
+# Seconds a list_instances result is reused without asking the server again
+_LIST_CACHE_TTL = 2.0
+
+
+def _timeout_error(action: str, exc: Exception) -> APIError:
+    logger.error("%s timed out: %s", action, exc)
+    return APIError(f"{action} timed out after {_TIMEOUT[1]}s: {exc}")
+
+
+def encode_json(payload: Any) -> bytes:
+    """Encode a request payload once so it can be re-sent without re-serializing."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+def decode_json(data: bytes) -> Any:
+    """Decode a JSON payload, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class GPUaaSClient:
     """Client for interacting with GPUaaS API"""
 
-    def __init__(self, base_url: str = None):
+    def __init__(self, base_url: str = None, session: Optional[requests.Session] = None):
         self.base_url = base_url or settings.BASE_URL
-        self.session = requests.Session()
         self.token = None
         self.user_id = None
+        # (path, params) -> (etag, raw body, fetched_at) for conditional list_instances reads
+        self._list_cache: Dict[tuple, tuple] = {}
+
+        if session is not None:
+            # Caller-owned session (e.g. shared across threads); keep its adapters
+            self.session = session
+        else:
+            self.session = requests.Session()
+            self._mount_pooled_adapter()
 
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json"
         })
 
+    def _mount_pooled_adapter(self):
+        adapter = HTTPAdapter(
+            pool_connections=settings.LOAD_TEST_USERS * 2,
+            pool_maxsize=settings.LOAD_TEST_USERS * 4,
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD", "DELETE"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _post_json(self, url: str, payload: Any) -> requests.Response:
+        """POST a payload, or pre-encoded JSON bytes, relying on the session Content-Type"""
+        body = payload if isinstance(payload, bytes) else encode_json(payload)
+        return self.session.post(url, data=body, timeout=_TIMEOUT)
+
+    @staticmethod
+    def _json(response: requests.Response) -> Dict:
+        """Decode a response body, using orjson when available"""
+        if orjson is None:
+            return response.json()
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            # Keep the requests exception type so callers' RequestException handlers apply
+            raise requests.exceptions.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
     def login(self, username: str = None, password: str = None) -> Dict:
         """Authenticate with the platform"""
         username = username or settings.TEST_USER
@@ -32,13 +111,13 @@ class GPUaaSClient:
         url = f"{self.base_url}/api/v1/auth/login"
         payload = {"username": username, "password": password}
 
-        logger.info(f"Logging in as {username}")
+        logger.info("Logging in as %s", username)
 
         try:
-            response = self.session.post(url, json=payload)
+            response = self._post_json(url, payload)
             response.raise_for_status()
 
-            data = response.json()
+            data = self._json(response)
             self.token = data["access_token"]
             self.user_id = data["user_id"]
 
@@ -46,11 +125,13 @@ class GPUaaSClient:
                 "Authorization": f"Bearer {self.token}"
             })
 
-            logger.info(f"Login successful. User ID: {self.user_id}")
+            logger.info("Login successful. User ID: %s", self.user_id)
             return data
 
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Login", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Login failed: {exc}")
+            logger.error("Login failed: %s", exc)
             raise APIError(f"Authentication failed: {exc}") from exc
 
     def verify_token(self) -> bool:
@@ -59,10 +140,9 @@ class GPUaaSClient:
             return False
 
         url = f"{self.base_url}/api/v1/auth/verify"
-        params = {"token": self.token}
 
         try:
-            response = self.session.get(url, params=params)
+            response = self.session.head(url, timeout=_TIMEOUT)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
@@ -78,51 +158,169 @@ class GPUaaSClient:
             **kwargs
         }
 
-        logger.info(f"Creating GPU instance: {data}")
+        logger.info("Creating GPU instance: %s", data)
 
+        response = None
         try:
-            response = self.session.post(url, json=data)
+            response = self._post_json(url, data)
+            self._list_cache.clear()
             response.raise_for_status()
 
-            result = response.json()
-            logger.info(f"Instance creation initiated: {result.get('instance_id')}")
+            result = self._json(response)
+            logger.info("Instance creation initiated: %s", result.get('instance_id'))
             return result
 
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Instance creation", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to create instance: {exc}")
-            if 'response' in locals() and response is not None and response.status_code == 400:
-                error_detail = response.json().get('detail', str(exc))
+            logger.error("Failed to create instance: %s", exc)
+            if response is not None and response.status_code == 400:
+                error_detail = self._json(response).get('detail', str(exc))
                 raise APIError(f"Bad request: {error_detail}") from exc
             raise APIError(f"Instance creation failed: {exc}") from exc
 
+    def create_gpu_instances_batch(self, specs: List[Dict]) -> List[str]:
+        """Create several GPU instances in one request, returning their IDs in order"""
+        url = f"{self.base_url}/api/v1/gpu/instances/batch"
+
+        data = {
+            "instances": [
+                {"gpu_type": "A100", "count": 1, "region": "us-east-1", **spec}
+                for spec in specs
+            ]
+        }
+
+        logger.info("Creating %d GPU instances in one batch", len(specs))
+
+        response = None
+        try:
+            response = self._post_json(url, data)
+            self._list_cache.clear()
+            response.raise_for_status()
+
+            instance_ids = [i["instance_id"] for i in self._json(response)["instances"]]
+            logger.info("Batch instance creation initiated: %s", instance_ids)
+            return instance_ids
+
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Batch instance creation", exc) from exc
+        except requests.exceptions.RequestException as exc:
+            logger.error("Failed to create instance batch: %s", exc)
+            if response is not None and response.status_code == 400:
+                error_detail = self._json(response).get('detail', str(exc))
+                raise APIError(f"Bad request: {error_detail}") from exc
+            raise APIError(f"Batch instance creation failed: {exc}") from exc
+
     def get_instance(self, instance_id: str) -> Dict:
         """Get details of a specific GPU instance"""
         url = f"{self.base_url}/api/v1/gpu/instances/{instance_id}"
 
         try:
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return self._json(response)
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Get instance", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to get instance {instance_id}: {exc}")
+            logger.error("Failed to get instance %s: %s", instance_id, exc)
             raise APIError(f"Failed to get instance: {exc}") from exc
 
-    def list_instances(self, **filters) -> Dict:
-        """List all GPU instances with optional filters"""
-        url = f"{self.base_url}/api/v1/gpu/instances"
+    def _long_poll(self, url: str, state: str, timeout: float, action: str, fallback) -> Dict:
+        """GET url, asking the server to hold the response until the resource reaches state"""
+        wait = max(0.0, min(timeout, _LONG_POLL_MAX))
+        params = {"wait_for": state, "timeout": wait}
 
         try:
-            response = self.session.get(url, params=filters)
+            # The read timeout has to outlast the server-side wait
+            response = self.session.get(
+                url, params=params, timeout=(_TIMEOUT[0], wait + _TIMEOUT[1])
+            )
+            if response.status_code == 400:
+                # Server does not support long-polling; answer with a plain read
+                return fallback()
             response.raise_for_status()
-            return response.json()
+            return self._json(response)
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error(action, exc) from exc
+        except requests.exceptions.RequestException as exc:
+            logger.error("%s failed: %s", action, exc)
+            raise APIError(f"{action} failed: {exc}") from exc
+
+    def wait_for_instance_state(self, instance_id: str, state: str, timeout: float = 30) -> Dict:
+        """Long-poll an instance until it reaches state, returning its latest details"""
+        url = f"{self.base_url}/api/v1/gpu/instances/{instance_id}"
+        return self._long_poll(
+            url, state, timeout, "Wait for instance", lambda: self.get_instance(instance_id)
+        )
+
+    def list_instances(self, use_cache: bool = True, **filters) -> Dict:
+        """
+        List all GPU instances with optional filters.
+
+        Results are reused for _LIST_CACHE_TTL seconds, then revalidated with
+        If-None-Match; creating or deleting instances through this client
+        drops the cache. State changes do not, so pollers waiting on a status
+        should pass use_cache=False to always revalidate with the server.
+        Every call returns a freshly decoded body that callers may mutate.
+        """
+        path = "/api/v1/gpu/instances"
+        url = f"{self.base_url}{path}"
+        key = (path, frozenset(filters.items()))
+
+        cached = self._list_cache.get(key)
+        if use_cache and cached and time.monotonic() - cached[2] < _LIST_CACHE_TTL:
+            return decode_json(cached[1])
+
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        try:
+            response = self.session.get(url, params=filters, headers=headers, timeout=_TIMEOUT)
+            if cached and response.status_code == 304:
+                self._list_cache[key] = (cached[0], cached[1], time.monotonic())
+                return decode_json(cached[1])
+            response.raise_for_status()
+
+            body = self._json(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._list_cache[key] = (etag, response.content, time.monotonic())
+            return body
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("List instances", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to list instances: {exc}")
+            logger.error("Failed to list instances: %s", exc)
             raise APIError(f"Failed to list instances: {exc}") from exc
 
+    def list_all_instances(self, page_size: int = 100, **filters) -> List[Dict]:
+        """
+        List instances across every page, fetching pages concurrently.
+
+        This runs its own event loop, so it cannot be called from async code
+        (async tests, pytest-asyncio fixtures); await
+        AsyncGPUaaSClient.list_all_instances there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "GPUaaSClient.list_all_instances() cannot run inside an event loop; "
+                "await AsyncGPUaaSClient.list_all_instances() instead"
+            )
+
+        from core.async_api_client import AsyncGPUaaSClient
+
+        async def fetch_all():
+            async with AsyncGPUaaSClient(self.base_url) as client:
+                if self.token:
+                    client.set_token(self.token)
+                return await client.list_all_instances(page_size=page_size, **filters)
+
+        return asyncio.run(fetch_all())
+
     def submit_job(self, instance_id: str, **kwargs) -> Dict:
         """Submit a job to a GPU instance"""
-        url = f"{self.base_url}/api/v1/jobs"
-
         data = {
             "instance_id": instance_id,
             "job_type": "training",
@@ -131,60 +329,149 @@ class GPUaaSClient:
             **kwargs
         }
 
-        logger.info(f"Submitting job to instance {instance_id}")
+        logger.info("Submitting job to instance %s", instance_id)
+
+        return self.submit_job_raw(encode_json(data))
+
+    def submit_job_raw(self, body: bytes) -> Dict:
+        """Submit a job from a pre-encoded JSON body (see encode_json)"""
+        url = f"{self.base_url}/api/v1/jobs"
 
         try:
-            response = self.session.post(url, json=data)
+            response = self._post_json(url, body)
             response.raise_for_status()
 
-            result = response.json()
-            logger.info(f"Job submitted: {result.get('job_id')}")
+            result = self._json(response)
+            logger.info("Job submitted: %s", result.get('job_id'))
             return result
 
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Job submission", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to submit job: {exc}")
+            logger.error("Failed to submit job: %s", exc)
             raise APIError(f"Job submission failed: {exc}") from exc
 
+    def submit_jobs_batch(self, specs: List[Dict]) -> List[str]:
+        """Submit several jobs in one request, returning their IDs in order"""
+        url = f"{self.base_url}/api/v1/jobs/batch"
+
+        data = {
+            "jobs": [
+                {
+                    "job_type": "training",
+                    "script_path": "/scripts/train.py",
+                    "parameters": {"epochs": 10, "batch_size": 32},
+                    **spec
+                }
+                for spec in specs
+            ]
+        }
+
+        logger.info("Submitting %d jobs in one batch", len(specs))
+
+        try:
+            response = self._post_json(url, data)
+            response.raise_for_status()
+
+            job_ids = [j["job_id"] for j in self._json(response)["jobs"]]
+            logger.info("Jobs submitted: %s", job_ids)
+            return job_ids
+
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Batch job submission", exc) from exc
+        except requests.exceptions.RequestException as exc:
+            logger.error("Failed to submit job batch: %s", exc)
+            raise APIError(f"Batch job submission failed: {exc}") from exc
+
+    def list_jobs(self, ids: Optional[List[str]] = None) -> Dict:
+        """List jobs, optionally only the given IDs"""
+        url = f"{self.base_url}/api/v1/jobs"
+        params = {"ids": ",".join(ids)} if ids else None
+
+        try:
+            response = self.session.get(url, params=params, timeout=_TIMEOUT)
+            response.raise_for_status()
+            return self._json(response)
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("List jobs", exc) from exc
+        except requests.exceptions.RequestException as exc:
+            logger.error("Failed to list jobs: %s", exc)
+            raise APIError(f"Failed to list jobs: {exc}") from exc
+
     def get_job(self, job_id: str) -> Dict:
         """Get job status and details"""
         url = f"{self.base_url}/api/v1/jobs/{job_id}"
 
         try:
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return self._json(response)
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Get job", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to get job {job_id}: {exc}")
+            logger.error("Failed to get job %s: %s", job_id, exc)
             raise APIError(f"Failed to get job: {exc}") from exc
 
+    def wait_for_job_state(self, job_id: str, state: str, timeout: float = 30) -> Dict:
+        """Long-poll a job until it reaches state (or finishes), returning its latest details"""
+        url = f"{self.base_url}/api/v1/jobs/{job_id}"
+        return self._long_poll(url, state, timeout, "Wait for job", lambda: self.get_job(job_id))
+
+    def stream_job_events(self, job_id: str, timeout: float = 300) -> Iterator[Dict]:
+        """Yield job status/progress events as the server pushes them, until the job finishes"""
+        url = f"{self.base_url}/api/v1/jobs/{job_id}/events"
+        deadline = time.monotonic() + timeout
+
+        try:
+            # The read timeout bounds the gap between events, the deadline the whole stream
+            with self.session.get(
+                url, headers={"Accept": "text/event-stream"}, stream=True, timeout=_TIMEOUT
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if line.startswith(b"data:"):
+                        yield decode_json(line[len(b"data:"):])
+                    if time.monotonic() > deadline:
+                        raise APIError(f"Job {job_id} events did not finish within {timeout}s")
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Job event stream", exc) from exc
+        except requests.exceptions.RequestException as exc:
+            logger.error("Job event stream for %s failed: %s", job_id, exc)
+            raise APIError(f"Job event stream failed: {exc}") from exc
+
     def get_metrics(self, **filters) -> Dict:
         """Get metrics data"""
         url = f"{self.base_url}/api/v1/metrics"
 
         try:
-            response = self.session.get(url, params=filters)
+            response = self.session.get(url, params=filters, timeout=_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return self._json(response)
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Get metrics", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to get metrics: {exc}")
+            logger.error("Failed to get metrics: %s", exc)
             raise APIError(f"Failed to get metrics: {exc}") from exc
 
     def delete_instance(self, instance_id: str) -> Dict:
         """Delete/terminate a GPU instance"""
         url = f"{self.base_url}/api/v1/gpu/instances/{instance_id}"
 
-        logger.info(f"Deleting instance {instance_id}")
+        logger.info("Deleting instance %s", instance_id)
 
         try:
-            response = self.session.delete(url)
+            response = self.session.delete(url, timeout=_TIMEOUT)
+            self._list_cache.clear()
             response.raise_for_status()
 
-            result = response.json()
-            logger.info(f"Instance deletion initiated: {result}")
+            result = self._json(response)
+            logger.info("Instance deletion initiated: %s", result)
             return result
 
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Instance deletion", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Failed to delete instance: {exc}")
+            logger.error("Failed to delete instance: %s", exc)
             raise APIError(f"Instance deletion failed: {exc}") from exc
 
     def health_check(self) -> Dict:
@@ -192,9 +479,25 @@ class GPUaaSClient:
         url = f"{self.base_url}/health"
 
         try:
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return self._json(response)
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Health check", exc) from exc
         except requests.exceptions.RequestException as exc:
-            logger.error(f"Health check failed: {exc}")
+            logger.error("Health check failed: %s", exc)
             raise APIError(f"Health check failed: {exc}") from exc
+
+    def batch(self, calls: List[Dict]) -> List[Dict]:
+        """Send several GET calls in one round trip, returning their responses in order"""
+        url = f"{self.base_url}/api/v1/batch"
+
+        try:
+            response = self._post_json(url, {"requests": calls})
+            response.raise_for_status()
+            return self._json(response)["responses"]
+        except requests.exceptions.Timeout as exc:
+            raise _timeout_error("Batch request", exc) from exc
+        except requests.exceptions.RequestException as exc:
+            logger.error("Batch request failed: %s", exc)
+            raise APIError(f"Batch request failed: {exc}") from exc
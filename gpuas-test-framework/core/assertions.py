@@ -1,8 +1,43 @@
+import atexit
+import logging
+import threading
 import time
-from typing import Callable, Any
+from typing import Callable, Dict, Iterable, List, Optional
 from utils.logger import logger
 
 
+_REQUIRED_METRIC_FIELDS = frozenset({"timestamp", "gpu_utilization", "memory_used_mb"})
+
+_client_local = threading.local()
+
+
+def _client():
+    """Return this thread's authenticated GPUaaSClient, creating it on first use."""
+    client = getattr(_client_local, "client", None)
+    if client is None:
+        from core.api_client import GPUaaSClient
+
+        client = GPUaaSClient()
+        client.login()
+        atexit.register(client.session.close)
+        _client_local.client = client
+    return client
+
+
+def _next_delay(current: float, cap: float) -> float:
+    """Double a polling delay, never exceeding the caller's interval."""
+    return min(current * 2, cap)
+
+
+def _check(condition_func: Callable[[], bool]) -> bool:
+    """Evaluate a wait condition, treating an exception as not met yet."""
+    try:
+        return bool(condition_func())
+    except Exception as exc:
+        logger.debug("Condition check raised exception: %s", exc)
+        return False
+
+
 class CustomAssertions:
     """Custom assertions for GPUaaS testing"""
 
@@ -11,34 +46,105 @@ class CustomAssertions:
         condition_func: Callable[[], bool],
         timeout: int = 30,
         interval: int = 2,
-        error_msg: str = "Condition not met within timeout"
+        error_msg: str = "Condition not met within timeout",
+        min_interval: float = 0.1,
+        long_poll: Optional[Callable[[float], bool]] = None
     ) -> bool:
         """
         Assert that a condition becomes true within a timeout period.
+
+        Polling starts at min_interval and backs off exponentially up to interval.
+        If long_poll is given it is called with the seconds remaining between
+        checks, should block until the condition may have changed, and returns
+        whether it now holds; that result stands in for the next condition_func
+        call. If it raises, the loop falls back to plain polling.
         """
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        delay = min(min_interval, interval)
+        met = _check(condition_func)
 
-        while time.time() - start_time < timeout:
-            try:
-                if condition_func():
-                    logger.debug(f"Condition met after {time.time() - start_time:.1f}s")
-                    return True
-            except Exception as exc:
-                logger.debug(f"Condition check raised exception: {exc}")
+        while True:
+            if met:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Condition met after %.1fs", time.monotonic() - start_time)
+                return True
 
-            time.sleep(interval)
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            if long_poll is not None:
+                try:
+                    met = bool(long_poll(deadline - now))
+                except Exception as exc:
+                    logger.debug("Long-poll failed, falling back to polling: %s", exc)
+                    long_poll = None
+                if met:
+                    continue
+            # Only sleep for whatever part of the delay a long-poll didn't already spend
+            time.sleep(max(0.0, delay - (time.monotonic() - now)))
+            delay = _next_delay(delay, interval)
+            if long_poll is None:
+                met = _check(condition_func)
 
-        logger.error(f"{error_msg} (timeout: {timeout}s)")
+        logger.error("%s (timeout: %ss)", error_msg, timeout)
         raise AssertionError(error_msg)
 
+    @staticmethod
+    def assert_all_eventually(
+        conditions: Dict[str, Callable[[], bool]],
+        timeout: int = 30,
+        interval: int = 2,
+        error_msg: str = "Conditions not met within timeout",
+        min_interval: float = 0.1
+    ) -> bool:
+        """
+        Assert that several named conditions all become true within one timeout.
+
+        Every pending condition is evaluated once per tick and dropped as soon
+        as it holds, so N waits share a single polling loop.
+        """
+        pending = dict(conditions)
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        delay = min(min_interval, interval)
+
+        while True:
+            for name, condition_func in list(pending.items()):
+                try:
+                    if condition_func():
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Condition '%s' met after %.1fs", name, time.monotonic() - start_time
+                            )
+                        del pending[name]
+                except Exception as exc:
+                    logger.debug("Condition '%s' check raised exception: %s", name, exc)
+
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(delay)
+            delay = _next_delay(delay, interval)
+
+        if not pending:
+            return True
+
+        logger.error("%s (timeout: %ss): %s", error_msg, timeout, sorted(pending))
+        raise AssertionError(f"{error_msg}: {sorted(pending)}")
+
     @staticmethod
     def assert_api_response(
         response: dict,
         expected_status: str = None,
-        expected_fields: list = None,
+        expected_fields: Iterable[str] = None,
         error_msg: str = "API response validation failed"
     ):
-        """Assert API response contains expected data."""
+        """
+        Assert API response contains expected data.
+
+        expected_fields may be any iterable of keys; pass a set or frozenset
+        to avoid rebuilding one per call.
+        """
         if not response:
             raise AssertionError(f"{error_msg}: Response is empty")
 
@@ -48,10 +154,10 @@ class CustomAssertions:
             )
 
         if expected_fields:
-            missing_fields = [field for field in expected_fields if field not in response]
+            missing_fields = set(expected_fields).difference(response)
             if missing_fields:
                 raise AssertionError(
-                    f"{error_msg}: Missing fields in response: {missing_fields}"
+                    f"{error_msg}: Missing fields in response: {sorted(missing_fields)}"
                 )
 
     @staticmethod
@@ -63,9 +169,7 @@ class CustomAssertions:
     ):
         """Assert GPU instance reaches expected state."""
         if isinstance(instance, str):
-            from core.api_client import GPUaaSClient
-
-            client = GPUaaSClient()
+            client = _client()
 
             def check_state():
                 instance_data = client.get_instance(instance)
@@ -75,7 +179,10 @@ class CustomAssertions:
                 check_state,
                 timeout=timeout,
                 interval=interval,
-                error_msg=f"Instance {instance} did not reach state '{expected_state}'"
+                error_msg=f"Instance {instance} did not reach state '{expected_state}'",
+                long_poll=lambda remaining: client.wait_for_instance_state(
+                    instance, expected_state, remaining
+                ).get("status") == expected_state
             )
         else:
             if instance.get("status") != expected_state:
@@ -83,6 +190,34 @@ class CustomAssertions:
                     f"Instance state is '{instance.get('status')}', expected '{expected_state}'"
                 )
 
+    @staticmethod
+    def assert_instances_state(
+        instance_ids: List[str],
+        expected_state: str,
+        timeout: int = 60,
+        interval: int = 5
+    ):
+        """Assert several GPU instances reach expected state, one list call per tick."""
+        client = _client()
+        pending = set(instance_ids)
+
+        def check_states():
+            instances = client.list_instances(use_cache=False).get("instances", [])
+            for instance in instances:
+                if instance.get("status") == expected_state:
+                    pending.discard(instance.get("id"))
+            return not pending
+
+        try:
+            CustomAssertions.assert_eventually(
+                check_states,
+                timeout=timeout,
+                interval=interval,
+                error_msg=f"Instances did not reach state '{expected_state}'"
+            )
+        except AssertionError as exc:
+            raise AssertionError(f"{exc}: {sorted(pending)}") from exc
+
     @staticmethod
     def assert_job_completed(
         job: dict or str,
@@ -91,9 +226,7 @@ class CustomAssertions:
     ):
         """Assert job reaches completed or failed state."""
         if isinstance(job, str):
-            from core.api_client import GPUaaSClient
-
-            client = GPUaaSClient()
+            client = _client()
 
             def check_job():
                 job_data = client.get_job(job)
@@ -104,7 +237,11 @@ class CustomAssertions:
                 check_job,
                 timeout=timeout,
                 interval=interval,
-                error_msg=f"Job {job} did not complete within timeout"
+                error_msg=f"Job {job} did not complete within timeout",
+                # The server also releases the wait when the job fails
+                long_poll=lambda remaining: client.wait_for_job_state(
+                    job, "completed", remaining
+                ).get("status") in ["completed", "failed"]
             )
         else:
             status = job.get("status")
@@ -113,6 +250,38 @@ class CustomAssertions:
                     f"Job status is '{status}', expected 'completed' or 'failed'"
                 )
 
+    @staticmethod
+    def assert_jobs_completed(
+        job_ids: List[str],
+        timeout: int = 300,
+        interval: int = 10
+    ):
+        """Assert several jobs reach completed or failed state, one list call per tick."""
+        client = _client()
+        pending = set(job_ids)
+
+        def check_jobs():
+            jobs = client.list_jobs(ids=sorted(pending)).get("jobs", [])
+            for job in jobs:
+                if job.get("status") in ["completed", "failed"]:
+                    pending.discard(job.get("id"))
+            return not pending
+
+        try:
+            CustomAssertions.assert_eventually(
+                check_jobs,
+                timeout=timeout,
+                interval=interval,
+                error_msg="Jobs did not complete within timeout",
+                # Every job has to finish, so holding a read on any pending one loses nothing;
+                # once it is done, one list call settles the rest
+                long_poll=lambda remaining: client.wait_for_job_state(
+                    min(pending), "completed", remaining
+                ).get("status") in ["completed", "failed"] and check_jobs()
+            )
+        except AssertionError as exc:
+            raise AssertionError(f"{exc}: {sorted(pending)}") from exc
+
     @staticmethod
     def assert_metrics_present(metrics_response: dict, min_count: int = 1):
         """Assert metrics response contains expected data."""
@@ -130,10 +299,50 @@ class CustomAssertions:
                 f"Expected at least {min_count} metric entries, got {len(metrics)}"
             )
 
-        required_fields = ["timestamp", "gpu_utilization", "memory_used_mb"]
         for metric in metrics[:min_count]:
-            missing = [field for field in required_fields if field not in metric]
+            missing = _REQUIRED_METRIC_FIELDS.difference(metric)
             if missing:
                 raise AssertionError(
-                    f"Metric missing required fields: {missing}. Metric: {metric}"
+                    f"Metric missing required fields: {sorted(missing)}. Metric: {metric}"
                 )
+
+
+class BatchingWaiter:
+    """
+    Collect named wait conditions and check them together in one polling loop.
+
+    Usable as a context manager; registered conditions are flushed on exit.
+    """
+
+    def __init__(self, timeout: int = 60, interval: int = 2):
+        self.timeout = timeout
+        self.interval = interval
+        self.conditions: Dict[str, Callable[[], bool]] = {}
+
+    def register(self, name: str, condition_func: Callable[[], bool]):
+        """Register a condition to be awaited on the next flush."""
+        self.conditions[name] = condition_func
+        return self
+
+    def flush(self):
+        """Wait for all registered conditions, then clear them."""
+        if not self.conditions:
+            return True
+
+        conditions, self.conditions = self.conditions, {}
+        return CustomAssertions.assert_all_eventually(
+            conditions,
+            timeout=self.timeout,
+            interval=self.interval,
+            error_msg="Batched wait conditions not met within timeout"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.conditions.clear()
+        return False
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Dict, List
+
+import httpx
+from config.settings import settings
+from core.api_client import APIError
+from utils.logger import logger
+
+
+class AsyncGPUaaSClient:
+    """Asynchronous client for fanning out independent GPUaaS API calls"""
+
+    def __init__(self, base_url: str = None):
+        self.base_url = base_url or settings.BASE_URL
+        self.token = None
+        self.user_id = None
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(settings.TEST_TIMEOUT, connect=settings.WAIT_TIMEOUT),
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.LOAD_TEST_USERS * 2,
+                max_connections=settings.LOAD_TEST_USERS * 4,
+            ),
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            },
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool"""
+        await self._client.aclose()
+
+    async def _request(self, method: str, path: str, error_msg: str, **kwargs) -> Dict:
+        try:
+            response = await self._client.request(method, path, **kwargs)
+            response.raise_for_status()
+            return response.json()
+        except httpx.TimeoutException as exc:
+            logger.error("%s (timed out): %s", error_msg, exc)
+            raise APIError(f"{error_msg}: timed out after {settings.TEST_TIMEOUT}s: {exc}") from exc
+        except httpx.HTTPError as exc:
+            logger.error("%s: %s", error_msg, exc)
+            raise APIError(f"{error_msg}: {exc}") from exc
+
+    def set_token(self, token: str):
+        """Authenticate subsequent requests with an existing bearer token"""
+        self.token = token
+        self._client.headers["Authorization"] = f"Bearer {token}"
+
+    async def login(self, username: str = None, password: str = None) -> Dict:
+        """Authenticate with the platform"""
+        username = username or settings.TEST_USER
+        password = password or settings.TEST_PASSWORD
+
+        logger.info("Logging in as %s", username)
+
+        data = await self._request(
+            "POST",
+            "/api/v1/auth/login",
+            "Authentication failed",
+            json={"username": username, "password": password},
+        )
+        self.user_id = data["user_id"]
+        self.set_token(data["access_token"])
+
+        logger.info("Login successful. User ID: %s", self.user_id)
+        return data
+
+    async def create_gpu_instance(self, **kwargs) -> Dict:
+        """Create a new GPU instance"""
+        data = {
+            "gpu_type": "A100",
+            "count": 1,
+            "region": "us-east-1",
+            **kwargs
+        }
+
+        logger.info("Creating GPU instance: %s", data)
+        return await self._request(
+            "POST", "/api/v1/gpu/instances", "Instance creation failed", json=data
+        )
+
+    async def get_instance(self, instance_id: str) -> Dict:
+        """Get details of a specific GPU instance"""
+        return await self._request(
+            "GET", f"/api/v1/gpu/instances/{instance_id}", "Failed to get instance"
+        )
+
+    async def list_instances(self, **filters) -> Dict:
+        """List all GPU instances with optional filters"""
+        return await self._request(
+            "GET", "/api/v1/gpu/instances", "Failed to list instances", params=filters
+        )
+
+    async def list_all_instances(self, page_size: int = 100, **filters) -> List[Dict]:
+        """List instances across every page, fetching pages after the first concurrently"""
+        first = await self.list_instances(**filters, page=1, page_size=page_size)
+        rest = await asyncio.gather(*(
+            self.list_instances(**filters, page=page, page_size=page_size)
+            for page in range(2, first.get("total_pages", 1) + 1)
+        ))
+        return first["instances"] + [i for result in rest for i in result["instances"]]
+
+    async def submit_job(self, instance_id: str, **kwargs) -> Dict:
+        """Submit a job to a GPU instance"""
+        data = {
+            "instance_id": instance_id,
+            "job_type": "training",
+            "script_path": "/scripts/train.py",
+            "parameters": {"epochs": 10, "batch_size": 32},
+            **kwargs
+        }
+
+        logger.info("Submitting job to instance %s", instance_id)
+        return await self._request("POST", "/api/v1/jobs", "Job submission failed", json=data)
+
+    async def get_job(self, job_id: str) -> Dict:
+        """Get job status and details"""
+        return await self._request("GET", f"/api/v1/jobs/{job_id}", "Failed to get job")
+
+    async def get_metrics(self, **filters) -> Dict:
+        """Get metrics data"""
+        return await self._request(
+            "GET", "/api/v1/metrics", "Failed to get metrics", params=filters
+        )
+
+    async def delete_instance(self, instance_id: str) -> Dict:
+        """Delete/terminate a GPU instance"""
+        logger.info("Deleting instance %s", instance_id)
+        return await self._request(
+            "DELETE", f"/api/v1/gpu/instances/{instance_id}", "Instance deletion failed"
+        )
+
+    async def health_check(self) -> Dict:
+        """Check API health"""
+        return await self._request("GET", "/health", "Health check failed")
+
+    async def bulk_get_instances(self, instance_ids: List[str]) -> List[Dict]:
+        """Fetch several instances concurrently, preserving input order"""
+        return await asyncio.gather(*(self.get_instance(i) for i in instance_ids))
+
+    async def bulk_get_jobs(self, job_ids: List[str]) -> List[Dict]:
+        """Fetch several jobs concurrently, preserving input order"""
+        return await asyncio.gather(*(self.get_job(j) for j in job_ids))
@@ -1,7 +1,10 @@
 import time
 import pytest
+import pytest_asyncio
 from typing import Dict, Any
 from config.settings import settings
+from core.assertions import BatchingWaiter, _next_delay
+from core.async_api_client import AsyncGPUaaSClient
 from utils.logger import logger
 
 
@@ -9,29 +12,46 @@ class BaseTest:
     """Base test class with common utilities"""
 
     @pytest.fixture(autouse=True)
-    def setup_teardown(self):
+    def setup_teardown(self, request):
         """Setup and teardown for each test"""
-        self.test_start_time = time.time()
+        self.test_start_time = time.monotonic()
         self.test_name = None
+        self.waiter = BatchingWaiter()
 
         logger.info("Starting test setup")
         yield
 
-        duration = time.time() - self.test_start_time
-        logger.info(f"Test completed in {duration:.2f} seconds")
+        # A failed test already has its error; waiting on its queued conditions
+        # would only stall teardown and raise a second, misleading failure
+        rep_call = getattr(request.node, "rep_call", None)
+        if rep_call is not None and rep_call.passed:
+            self.waiter.flush()
+        else:
+            self.waiter.conditions.clear()
+
+        duration = time.monotonic() - self.test_start_time
+        logger.info("Test completed in %.2f seconds", duration)
+
+    @pytest_asyncio.fixture
+    async def async_client(self):
+        """Authenticated async client for concurrent API fan-out"""
+        async with AsyncGPUaaSClient() as client:
+            await client.login()
+            yield client
 
     def log_step(self, step: str, details: Dict = None):
         """Log a test step with details"""
-        logger.info(f"STEP: {step}")
+        logger.info("STEP: %s", step)
         if details:
-            logger.debug(f"Details: {details}")
+            logger.debug("Details: %s", details)
 
-    def assert_with_retry(self, condition_func, timeout=30, interval=2, error_msg=""):
-        """Assert with retry for eventual consistency"""
-        start_time = time.time()
+    def assert_with_retry(self, condition_func, timeout=30, interval=2, error_msg="", min_interval=0.1):
+        """Assert with retry for eventual consistency, backing off up to interval"""
+        deadline = time.monotonic() + timeout
+        delay = min(min_interval, interval)
         last_error = None
 
-        while time.time() - start_time < timeout:
+        while True:
             try:
                 result = condition_func()
                 if result:
@@ -39,7 +59,10 @@ class BaseTest:
             except AssertionError as exc:
                 last_error = exc
 
-            time.sleep(interval)
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(delay)
+            delay = _next_delay(delay, interval)
 
         if last_error:
             raise AssertionError(f"{error_msg}. Last error: {last_error}")
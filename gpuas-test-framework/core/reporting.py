@@ -1,56 +1,135 @@
 import json
-from datetime import datetime
+import time
 from pathlib import Path
+from string import Template
 from typing import Dict, Any, Optional
 
 import allure
 from config.settings import settings
 from utils.logger import logger
 
+_PNG = allure.attachment_type.PNG
+_JSON = allure.attachment_type.JSON
+_TEXT = allure.attachment_type.TEXT
+_HTML = allure.attachment_type.HTML
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data to indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    return json.dumps(data, indent=2)
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+_ts_cache = (None, "")
+
+
+def _iso_timestamp() -> str:
+    """Local ISO-8601 timestamp; strftime only runs when the second changes."""
+    global _ts_cache
+    sec, rem = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{rem // 1000:06d}"
+
+
+_HEADER_TPL = Template("""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>GPUaaS Test Report</title>
+                <style>
+                    body { font-family: Arial, sans-serif; margin: 20px; }
+                    .summary { background: #f5f5f5; padding: 20px; border-radius: 5px; }
+                    .test { border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }
+                    .passed { background: #d4edda; }
+                    .failed { background: #f8d7da; }
+                    .skipped { background: #fff3cd; }
+                    .timestamp { color: #666; font-size: 0.9em; }
+                </style>
+            </head>
+            <body>
+                <h1>GPUaaS Platform Test Report</h1>
+                <div class="summary">
+                    <h2>Summary</h2>
+                    <p>Total Tests: $total</p>
+                    <p>Passed: $passed</p>
+                    <p>Failed: $failed</p>
+                    <p>Skipped: $skipped</p>
+                    <p>Success Rate: $success_rate%</p>
+                    <p class="timestamp">Generated: $generated</p>
+                </div>
+                <h2>Test Details</h2>
+            """)
+
+_HTML_FOOTER = """
+            </body>
+            </html>
+            """
+
+_TEST_TPL = Template("""
+                <div class="test $status_class">
+                    <h3>$name</h3>
+                    <p>Status: <strong>$status</strong></p>
+                    <p>Duration: $duration seconds</p>
+                    <p>Message: $message</p>
+                </div>
+                """)
+
 
 class TestReporter:
     """Test reporting utilities with Allure integration"""
 
+    @staticmethod
+    def _attach_serialized(payload: str, name: str, attachment_type):
+        """Attach an already-serialized payload to the current Allure step."""
+        allure.attach(payload, name=name, attachment_type=attachment_type)
+
     @staticmethod
     def attach_screenshot(page, name: str = "screenshot"):
         """Attach screenshot to Allure report."""
         try:
-            screenshot = page.screenshot()
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{name}_{timestamp}.png"
+            filename = f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+            screenshot_path = settings.SCREENSHOT_DIR / filename
 
-            allure.attach(
-                screenshot,
+            # Playwright writes the file itself; Allure copies it from disk
+            page.screenshot(path=str(screenshot_path))
+            allure.attach.file(
+                str(screenshot_path),
                 name=filename,
-                attachment_type=allure.attachment_type.PNG
+                attachment_type=_PNG
             )
 
-            screenshot_path = settings.SCREENSHOT_DIR / filename
-            screenshot_path.write_bytes(screenshot)
-
-            logger.debug(f"Screenshot saved: {screenshot_path}")
+            logger.debug("Screenshot saved: %s", screenshot_path)
 
         except Exception as exc:
-            logger.error(f"Failed to capture screenshot: {exc}")
+            logger.error("Failed to capture screenshot: %s", exc)
 
     @staticmethod
     def attach_api_trace(request: Dict, response: Dict, name: str = "api_trace"):
         """Attach API request/response trace to Allure report."""
         try:
             trace_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _iso_timestamp(),
                 "request": request,
                 "response": response
             }
 
-            allure.attach(
-                json.dumps(trace_data, indent=2),
-                name=name,
-                attachment_type=allure.attachment_type.JSON
-            )
+            TestReporter._attach_serialized(_dumps(trace_data), name, _JSON)
 
         except Exception as exc:
-            logger.error(f"Failed to attach API trace: {exc}")
+            logger.error("Failed to attach API trace: %s", exc)
 
     @staticmethod
     def attach_text(content: str, name: str = "text_attachment"):
@@ -59,10 +138,10 @@ class TestReporter:
             allure.attach(
                 content,
                 name=name,
-                attachment_type=allure.attachment_type.TEXT
+                attachment_type=_TEXT
             )
         except Exception as exc:
-            logger.error(f"Failed to attach text: {exc}")
+            logger.error("Failed to attach text: %s", exc)
 
     @staticmethod
     def attach_html(content: str, name: str = "html_attachment"):
@@ -71,88 +150,71 @@ class TestReporter:
             allure.attach(
                 content,
                 name=name,
-                attachment_type=allure.attachment_type.HTML
+                attachment_type=_HTML
             )
         except Exception as exc:
-            logger.error(f"Failed to attach HTML: {exc}")
+            logger.error("Failed to attach HTML: %s", exc)
 
     @staticmethod
     def attach_json(data: Dict, name: str = "json_data"):
         """Attach JSON data to Allure report."""
         try:
-            allure.attach(
-                json.dumps(data, indent=2),
-                name=name,
-                attachment_type=allure.attachment_type.JSON
-            )
+            TestReporter._attach_serialized(_dumps(data), name, _JSON)
         except Exception as exc:
-            logger.error(f"Failed to attach JSON: {exc}")
+            logger.error("Failed to attach JSON: %s", exc)
 
     @staticmethod
     def log_test_step(step: str, details: Optional[Dict] = None):
         """Log a test step to Allure report."""
         with allure.step(step):
-            logger.info(f"Test Step: {step}")
+            logger.info("Test Step: %s", step)
             if details:
-                logger.debug(f"Step Details: {details}")
-                TestReporter.attach_json(details, f"step_{step.lower().replace(' ', '_')}")
+                try:
+                    payload = _dumps(details)
+                    TestReporter._attach_serialized(
+                        payload, f"step_{step.lower().replace(' ', '_')}", _JSON
+                    )
+                    logger.debug("Step Details: %s", payload)
+                except Exception as exc:
+                    logger.error("Failed to attach step details: %s", exc)
+
+    @staticmethod
+    def _render_test(test: Dict) -> str:
+        """Render the HTML block for a single test result."""
+        return _TEST_TPL.substitute(
+            status_class=test.get('status', '').lower(),
+            name=test.get('name', 'Unknown Test'),
+            status=test.get('status', 'UNKNOWN'),
+            duration=f"{test.get('duration', 0):.2f}",
+            message=test.get('message', ''),
+        )
 
     @staticmethod
     def generate_html_report(test_results: Dict):
         """Generate a simple HTML test report."""
         try:
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>GPUaaS Test Report</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                    .summary {{ background: #f5f5f5; padding: 20px; border-radius: 5px; }}
-                    .test {{ border: 1px solid #ddd; margin: 10px 0; padding: 15px; border-radius: 5px; }}
-                    .passed {{ background: #d4edda; }}
-                    .failed {{ background: #f8d7da; }}
-                    .skipped {{ background: #fff3cd; }}
-                    .timestamp {{ color: #666; font-size: 0.9em; }}
-                </style>
-            </head>
-            <body>
-                <h1>GPUaaS Platform Test Report</h1>
-                <div class="summary">
-                    <h2>Summary</h2>
-                    <p>Total Tests: {test_results.get('total', 0)}</p>
-                    <p>Passed: {test_results.get('passed', 0)}</p>
-                    <p>Failed: {test_results.get('failed', 0)}</p>
-                    <p>Skipped: {test_results.get('skipped', 0)}</p>
-                    <p>Success Rate: {test_results.get('success_rate', 0)}%</p>
-                    <p class="timestamp">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                </div>
-                <h2>Test Details</h2>
-            """
-
-            for test in test_results.get('tests', []):
-                status_class = test.get('status', '').lower()
-                html_content += f"""
-                <div class="test {status_class}">
-                    <h3>{test.get('name', 'Unknown Test')}</h3>
-                    <p>Status: <strong>{test.get('status', 'UNKNOWN')}</strong></p>
-                    <p>Duration: {test.get('duration', 0):.2f} seconds</p>
-                    <p>Message: {test.get('message', '')}</p>
-                </div>
-                """
-
-            html_content += """
-            </body>
-            </html>
-            """
-
-            report_file = settings.REPORT_DIR / f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            report_file.write_text(html_content)
-
-            logger.info(f"HTML report generated: {report_file}")
-
-            return html_content
+            now = time.localtime()
+            parts = [
+                _HEADER_TPL.substitute(
+                    total=test_results.get('total', 0),
+                    passed=test_results.get('passed', 0),
+                    failed=test_results.get('failed', 0),
+                    skipped=test_results.get('skipped', 0),
+                    success_rate=test_results.get('success_rate', 0),
+                    generated=time.strftime('%Y-%m-%d %H:%M:%S', now),
+                )
+            ]
+            parts.extend(TestReporter._render_test(test) for test in test_results.get('tests', []))
+            parts.append(_HTML_FOOTER)
+
+            report_file = settings.REPORT_DIR / f"test_report_{time.strftime('%Y%m%d_%H%M%S', now)}.html"
+            with report_file.open("w") as report:
+                report.writelines(parts)
+
+            logger.info("HTML report generated: %s", report_file)
+
+            return "".join(parts)
 
         except Exception as exc:
-            logger.error(f"Failed to generate HTML report: {exc}")
+            logger.error("Failed to generate HTML report: %s", exc)
             return None
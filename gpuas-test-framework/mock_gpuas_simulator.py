@@ -3,20 +3,43 @@ Mock GPUaaS Platform Server
 Simulates key GPU-as-a-Service functionality for testing
 """
 import asyncio
+import hashlib
+import json
 import logging
 import random
 import time
 import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException, status
+import httpx
+import numpy as np
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, Query, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_RNG = np.random.default_rng()
+MOCK_DATA_SEED = 42
+METRICS_HISTORY = 10000  # samples kept in db.metrics; older ones are overwritten
+_SAMPLES_PER_INSTANCE = 10
+BATCH_MAX_REQUESTS = 20
+_METRIC_FIELDS = frozenset((
+    "timestamp", "instance_id", "gpu_utilization", "memory_used_mb",
+    "memory_total_mb", "power_draw_w", "temperature_c",
+))
+
+
+# Whitelists are validated by set membership rather than a regex match per request
+GpuType = Literal["A100", "H100", "V100", "RTX4090"]
+JobType = Literal["training", "inference", "fine-tuning"]
+MetricType = Literal["gpu_utilization", "memory_usage", "power_draw"]
+
 
 class LoginRequest(BaseModel):
     username: str
@@ -24,29 +47,60 @@ class LoginRequest(BaseModel):
 
 
 class GPUInstanceRequest(BaseModel):
-    gpu_type: str = Field(default="A100", regex="^(A100|H100|V100|RTX4090)$")
+    gpu_type: GpuType = "A100"
     count: int = Field(default=1, ge=1, le=8)
     region: str = Field(default="us-east-1")
     instance_name: Optional[str] = None
 
 
+class GPUInstanceBatchRequest(BaseModel):
+    instances: List[GPUInstanceRequest] = Field(min_length=1)
+
+
 class JobRequest(BaseModel):
     instance_id: str
-    job_type: str = Field(default="training", regex="^(training|inference|fine-tuning)$")
+    job_type: JobType = "training"
     script_path: str
     parameters: Dict = Field(default_factory=dict)
 
 
+class JobBatchRequest(BaseModel):
+    jobs: List[JobRequest] = Field(min_length=1)
+
+
+class BatchSubRequest(BaseModel):
+    method: Literal["GET"] = "GET"
+    url: str = Field(pattern=r"^/")
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest] = Field(min_length=1, max_length=BATCH_MAX_REQUESTS)
+
+
 class MetricsRequest(BaseModel):
     start_time: datetime
     end_time: datetime
-    metric_type: str = Field(regex="^(gpu_utilization|memory_usage|power_draw)$")
+    metric_type: MetricType
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    ticker = asyncio.create_task(advance_simulations())
+    # Batch sub-requests are dispatched straight into the app, without touching the network
+    app.state.batch_client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://batch"
+    )
+    yield
+    ticker.cancel()
+    await app.state.batch_client.aclose()
 
 
 app = FastAPI(
     title="Mock GPUaaS Platform API",
     description="Mock server simulating GPU-as-a-Service functionality",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -58,6 +112,73 @@ app.add_middleware(
 )
 
 
+def _job_progress(job: dict, now: float) -> float:
+    return min(95, ((now - job["submitted_at"]) / 30) * 100)
+
+
+class MetricsStore:
+    """Ring buffer of metric samples stored as one NumPy column per field"""
+
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.n = 0  # samples ever written; slot for the next one is n % cap
+        self.ts = np.zeros(cap, "f8")
+        self.instance_id = np.empty(cap, object)
+        self.util = np.zeros(cap, "f4")
+        self.mem_used = np.zeros(cap, "i4")
+        self.power = np.zeros(cap, "f4")
+        self.temp = np.zeros(cap, "f4")
+
+    def __len__(self):
+        return min(self.n, self.cap)
+
+    def extend(self, ts: float, instance_ids, util, mem_used, power, temp):
+        k = len(util)
+        if k > self.cap:
+            # Only the newest cap samples would survive anyway
+            self.n += k - self.cap
+            instance_ids, util, mem_used, power, temp = (
+                col[-self.cap:] for col in (instance_ids, util, mem_used, power, temp)
+            )
+            k = self.cap
+
+        slots = (self.n + np.arange(k)) % self.cap
+        self.ts[slots] = ts
+        self.instance_id[slots] = instance_ids
+        self.util[slots] = util
+        self.mem_used[slots] = mem_used
+        self.power[slots] = power
+        self.temp[slots] = temp
+        self.n += k
+
+    def to_dicts(self, last: int) -> List[dict]:
+        """The newest `last` samples in the API's per-sample dict shape"""
+        last = min(last, len(self))
+        slots = (self.n - last + np.arange(last)) % self.cap
+        timestamps = self.ts[slots].tolist()
+        # Samples from one request share a timestamp, so convert each distinct one once
+        stamps = {ts: datetime.fromtimestamp(ts) for ts in set(timestamps)}
+        return [
+            {
+                "timestamp": stamps[ts],
+                "instance_id": inst_id,
+                "gpu_utilization": util,
+                "memory_used_mb": mem,
+                "memory_total_mb": 4096,
+                "power_draw_w": power,
+                "temperature_c": temp,
+            }
+            for ts, inst_id, util, mem, power, temp in zip(
+                timestamps,
+                self.instance_id[slots].tolist(),
+                self.util[slots].tolist(),
+                self.mem_used[slots].tolist(),
+                self.power[slots].tolist(),
+                self.temp[slots].tolist(),
+            )
+        ]
+
+
 class MockDatabase:
     def __init__(self):
         self.users = {
@@ -69,44 +190,100 @@ class MockDatabase:
                 "gpu_quota": 16,
             }
         }
+        self.users_by_id = {u["user_id"]: u for u in self.users.values()}
+        self.tokens = {u["token"]: u["user_id"] for u in self.users.values()}
         self.instances: Dict[str, dict] = {}
         self.jobs: Dict[str, dict] = {}
-        self.metrics: List[dict] = []
+        self.metrics = MetricsStore(METRICS_HISTORY)
         self.billing_records: List[dict] = []
 
+        # Secondary indexes, kept in step with instances/jobs by the helpers below.
+        # Inner dicts map id -> record so per-user listings keep creation order.
+        self.instances_by_user: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        self.jobs_by_instance: Dict[str, Dict[str, dict]] = defaultdict(dict)
+        self.user_gpu_count: Dict[str, int] = defaultdict(int)
+
+        # Simulated work, advanced by advance_simulations():
+        # instance_id -> ready-at time, job_id -> (index into JOB_STATES, next-step time)
+        self.pending_provision: Dict[str, float] = {}
+        self.pending_jobs: Dict[str, Tuple[int, float]] = {}
+
         self._initialize_mock_data()
 
-    def _initialize_mock_data(self):
-        for i in range(3):
+    def _initialize_mock_data(self, n_instances: int = 3):
+        # Every column is drawn up front from a fixed seed, so the fleet is the same each run
+        rng = np.random.default_rng(MOCK_DATA_SEED)
+        now = time.time()
+
+        instance_rows = zip(
+            rng.choice(["A100", "H100", "V100"], n_instances).tolist(),
+            rng.integers(1, 4, n_instances, endpoint=True).tolist(),
+            rng.choice(["us-east-1", "eu-west-1"], n_instances).tolist(),
+            rng.integers(3600, 86400, n_instances, endpoint=True).tolist(),
+            rng.integers(1, 255, (n_instances, 2), endpoint=True).tolist(),
+            rng.uniform(2.5, 8.5, n_instances).tolist(),
+        )
+        jobs_per_instance = rng.integers(1, 3, n_instances, endpoint=True)
+        n_jobs = int(jobs_per_instance.sum())
+        job_rows = zip(
+            rng.choice(["training", "inference"], n_jobs).tolist(),
+            rng.choice(["completed", "running", "failed"], n_jobs).tolist(),
+            rng.integers(600, 7200, n_jobs, endpoint=True).tolist(),
+            rng.integers(300, 3600, n_jobs, endpoint=True).tolist(),
+            rng.uniform(30, 95, n_jobs).tolist(),
+        )
+
+        for i, (gpu_type, count, region, age, (ip_c, ip_d), rate) in enumerate(instance_rows):
             instance_id = f"inst_{1000 + i}"
-            self.instances[instance_id] = {
+            self.add_instance({
                 "id": instance_id,
                 "user_id": "usr_001",
-                "gpu_type": random.choice(["A100", "H100", "V100"]),
-                "count": random.randint(1, 4),
+                "gpu_type": gpu_type,
+                "count": count,
                 "status": "active",
-                "region": random.choice(["us-east-1", "eu-west-1"]),
-                "created_at": time.time() - random.randint(3600, 86400),
-                "ip_address": f"10.0.{random.randint(1,255)}.{random.randint(1,255)}",
-                "hourly_rate": random.uniform(2.5, 8.5),
-            }
-
-            for j in range(random.randint(1, 3)):
+                "region": region,
+                "created_at": now - age,
+                "ip_address": f"10.0.{ip_c}.{ip_d}",
+                "hourly_rate": rate,
+            })
+
+            for j in range(jobs_per_instance[i]):
+                job_type, job_status, job_age, duration, utilization = next(job_rows)
                 job_id = f"job_{10000 + i * 3 + j}"
-                self.jobs[job_id] = {
+                self.add_job({
                     "id": job_id,
                     "instance_id": instance_id,
                     "user_id": "usr_001",
-                    "job_type": random.choice(["training", "inference"]),
-                    "status": random.choice(["completed", "running", "failed"]),
-                    "submitted_at": time.time() - random.randint(600, 7200),
-                    "duration": random.randint(300, 3600),
-                    "gpu_utilization": random.uniform(30, 95),
-                }
+                    "job_type": job_type,
+                    "status": job_status,
+                    "submitted_at": now - job_age,
+                    "duration": duration,
+                    "gpu_utilization": utilization,
+                })
+
+        # Seeded running jobs are not driven by the tick loop, so set their progress once
+        for job in self.jobs.values():
+            if job["status"] == "running":
+                job["progress"] = _job_progress(job, now)
+
+    def add_instance(self, instance: dict):
+        self.instances[instance["id"]] = instance
+        self.instances_by_user[instance["user_id"]][instance["id"]] = instance
+        self.user_gpu_count[instance["user_id"]] += instance["count"]
+
+    def remove_instance(self, instance_id: str):
+        instance = self.instances.pop(instance_id)
+        self.instances_by_user[instance["user_id"]].pop(instance_id, None)
+        self.user_gpu_count[instance["user_id"]] -= instance["count"]
+        self.jobs_by_instance.pop(instance_id, None)
+
+    def add_job(self, job: dict):
+        self.jobs[job["id"]] = job
+        self.jobs_by_instance[job["instance_id"]][job["id"]] = job
 
     def generate_metrics(self, instance_id: str):
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "instance_id": instance_id,
             "gpu_utilization": random.uniform(10, 99),
             "memory_used_mb": random.randint(1024, 4096),
@@ -119,24 +296,20 @@ class MockDatabase:
 db = MockDatabase()
 
 
-async def simulate_provisioning(instance_id: str):
-    await asyncio.sleep(random.uniform(3, 8))
-    if instance_id in db.instances:
-        db.instances[instance_id]["status"] = "active"
-        logger.info(f"Instance {instance_id} provisioned successfully")
+JOB_STATES = ("queued", "initializing", "running", "completing")
+TICK_INTERVAL = 0.5
 
 
-async def simulate_job_execution(job_id: str):
-    job = db.jobs.get(job_id)
-    if not job:
-        return
+def simulate_provisioning(instance_id: str):
+    db.pending_provision[instance_id] = time.time() + random.uniform(3, 8)
 
-    states = ["queued", "initializing", "running", "completing"]
 
-    for state in states:
-        job["status"] = state
-        await asyncio.sleep(random.uniform(2, 5))
+def simulate_job_execution(job_id: str):
+    db.jobs[job_id]["status"] = JOB_STATES[0]
+    db.pending_jobs[job_id] = (0, time.time() + random.uniform(2, 5))
 
+
+def _finish_job(job_id: str, job: dict):
     job["status"] = "completed" if random.random() > 0.1 else "failed"
     job["completed_at"] = time.time()
 
@@ -150,6 +323,54 @@ async def simulate_job_execution(job_id: str):
     logger.info(f"Job {job_id} finished with status: {job['status']}")
 
 
+def _tick(now: float):
+    for instance_id, ready_at in list(db.pending_provision.items()):
+        if now < ready_at:
+            continue
+        del db.pending_provision[instance_id]
+        if instance_id in db.instances:
+            db.instances[instance_id]["status"] = "active"
+            logger.info(f"Instance {instance_id} provisioned successfully")
+
+    for job_id, (step, next_at) in list(db.pending_jobs.items()):
+        job = db.jobs.get(job_id)
+        if job is not None and job["status"] == "running":
+            job["progress"] = _job_progress(job, now)
+        if now < next_at:
+            continue
+        step += 1
+        if job is None or step == len(JOB_STATES):
+            del db.pending_jobs[job_id]
+            if job is not None:
+                _finish_job(job_id, job)
+            continue
+        job["status"] = JOB_STATES[step]
+        db.pending_jobs[job_id] = (step, now + random.uniform(2, 5))
+
+
+LONG_POLL_MAX = 60  # seconds a ?wait_for= read may be held open
+
+
+async def wait_for_status(record: dict, wait_for: Optional[str], timeout: float, final=()):
+    # Long-poll: hold the read until the record reaches wait_for (or a final state it
+    # can never leave) or the timeout expires; records are updated in place by _tick
+    deadline = time.monotonic() + timeout
+    while (
+        wait_for
+        and record["status"] != wait_for
+        and record["status"] not in final
+        and time.monotonic() < deadline
+    ):
+        await asyncio.sleep(TICK_INTERVAL)
+
+
+# One background loop drives every pending provision and job, instead of a task each
+async def advance_simulations():
+    while True:
+        _tick(time.time())
+        await asyncio.sleep(TICK_INTERVAL)
+
+
 @app.post("/api/v1/auth/login", status_code=status.HTTP_200_OK)
 async def login(credentials: LoginRequest):
     user = db.users.get(credentials.username)
@@ -170,39 +391,43 @@ async def login(credentials: LoginRequest):
     }
 
 
-@app.get("/api/v1/auth/verify")
-async def verify_token(token: str):
-    for user in db.users.values():
-        if user["token"] == token:
-            return {"valid": True, "user_id": user["user_id"]}
+async def get_user_id(token: str = "mock_token_test_user") -> str:
+    user_id = db.tokens.get(token)
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+        )
 
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid token",
-    )
+    return user_id
 
 
-@app.post("/api/v1/gpu/instances", status_code=status.HTTP_202_ACCEPTED)
-async def create_gpu_instance(
-    request: GPUInstanceRequest,
-    background_tasks: BackgroundTasks,
-    token: str = "mock_token_test_user",
+@app.api_route("/api/v1/auth/verify", methods=["GET", "HEAD"])
+async def verify(
+    token: Optional[str] = None,
+    authorization: Optional[str] = Header(default=None),
 ):
-    auth_result = await verify_token(token)
-    user_id = auth_result["user_id"]
+    if token is None and authorization and authorization.startswith("Bearer "):
+        token = authorization[len("Bearer "):]
+
+    return {"valid": True, "user_id": await get_user_id(token)}
+
 
-    user_instances = [i for i in db.instances.values() if i["user_id"] == user_id]
-    total_gpus = sum(i["count"] for i in user_instances)
+def _check_gpu_quota(user_id: str, requested: int):
+    total_gpus = db.user_gpu_count[user_id]
+    gpu_quota = db.users_by_id[user_id]["gpu_quota"]
 
-    if total_gpus + request.count > db.users[user_id]["gpu_quota"]:
+    if total_gpus + requested > gpu_quota:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Exceeds GPU quota. Available: {db.users[user_id]['gpu_quota'] - total_gpus}",
+            detail=f"Exceeds GPU quota. Available: {gpu_quota - total_gpus}",
         )
 
+
+def _provision_instance(user_id: str, request: GPUInstanceRequest) -> str:
     instance_id = f"inst_{uuid.uuid4().hex[:8]}"
 
-    db.instances[instance_id] = {
+    db.add_instance({
         "id": instance_id,
         "user_id": user_id,
         "gpu_type": request.gpu_type,
@@ -213,11 +438,21 @@ async def create_gpu_instance(
         "created_at": time.time(),
         "ip_address": None,
         "hourly_rate": 3.50 if request.gpu_type == "A100" else 4.50,
-    }
+    })
 
-    background_tasks.add_task(simulate_provisioning, instance_id)
+    simulate_provisioning(instance_id)
 
     logger.info(f"Creating GPU instance {instance_id}: {request.gpu_type} x{request.count}")
+    return instance_id
+
+
+@app.post("/api/v1/gpu/instances", status_code=status.HTTP_202_ACCEPTED)
+async def create_gpu_instance(
+    request: GPUInstanceRequest,
+    user_id: str = Depends(get_user_id),
+):
+    _check_gpu_quota(user_id, request.count)
+    instance_id = _provision_instance(user_id, request)
 
     return {
         "instance_id": instance_id,
@@ -227,34 +462,76 @@ async def create_gpu_instance(
     }
 
 
+@app.post("/api/v1/gpu/instances/batch", status_code=status.HTTP_202_ACCEPTED)
+async def create_gpu_instances_batch(
+    request: GPUInstanceBatchRequest,
+    user_id: str = Depends(get_user_id),
+):
+    # All-or-nothing: the whole batch must fit in the remaining quota
+    _check_gpu_quota(user_id, sum(spec.count for spec in request.instances))
+    instance_ids = [_provision_instance(user_id, spec) for spec in request.instances]
+
+    return {
+        "count": len(instance_ids),
+        "instances": [
+            {"instance_id": instance_id, "status": "provisioning"}
+            for instance_id in instance_ids
+        ],
+        "message": "Instances are being provisioned",
+        "estimated_completion": "30 seconds",
+    }
+
+
 @app.get("/api/v1/gpu/instances")
 async def list_instances(
-    token: str = "mock_token_test_user",
+    user_id: str = Depends(get_user_id),
     status_filter: Optional[str] = None,
     region: Optional[str] = None,
+    page: int = Query(default=1, ge=1),
+    page_size: Optional[int] = Query(default=None, ge=1),
+    if_none_match: Optional[str] = Header(default=None),
 ):
-    auth_result = await verify_token(token)
-    user_id = auth_result["user_id"]
-
-    instances = [i for i in db.instances.values() if i["user_id"] == user_id]
-
-    if status_filter:
-        instances = [i for i in instances if i["status"] == status_filter]
-    if region:
-        instances = [i for i in instances if i["region"] == region]
-
-    return {
+    # Filter and total in a single pass over the user's index
+    instances = []
+    total_gpus = 0
+    for instance in db.instances_by_user.get(user_id, {}).values():
+        if status_filter and instance["status"] != status_filter:
+            continue
+        if region and instance["region"] != region:
+            continue
+        instances.append(instance)
+        total_gpus += instance["count"]
+
+    total_pages = 1
+    if page_size:
+        total_pages = max(1, -(-len(instances) // page_size))
+        instances = instances[(page - 1) * page_size:page * page_size]
+
+    # Returned as a response object so FastAPI skips jsonable_encoder and orjson
+    # serializes the records directly
+    response = ORJSONResponse({
         "count": len(instances),
         "instances": instances,
-        "total_gpus": sum(i["count"] for i in instances),
-    }
+        "total_gpus": total_gpus,
+        "page": page,
+        "total_pages": total_pages,
+    })
 
+    # Pollers re-send the last ETag and get an empty 304 while nothing has changed
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
 
-@app.get("/api/v1/gpu/instances/{instance_id}")
-async def get_instance(instance_id: str, token: str = "mock_token_test_user"):
-    auth_result = await verify_token(token)
-    user_id = auth_result["user_id"]
 
+@app.get("/api/v1/gpu/instances/{instance_id}")
+async def get_instance(
+    instance_id: str,
+    user_id: str = Depends(get_user_id),
+    wait_for: Optional[str] = None,
+    timeout: float = Query(default=30, ge=0, le=LONG_POLL_MAX),
+):
     instance = db.instances.get(instance_id)
 
     if not instance or instance["user_id"] != user_id:
@@ -263,6 +540,8 @@ async def get_instance(instance_id: str, token: str = "mock_token_test_user"):
             detail="Instance not found or access denied",
         )
 
+    await wait_for_status(instance, wait_for, timeout, final=("terminating",))
+
     metrics = db.generate_metrics(instance_id)
 
     return {
@@ -272,16 +551,8 @@ async def get_instance(instance_id: str, token: str = "mock_token_test_user"):
     }
 
 
-@app.post("/api/v1/jobs", status_code=status.HTTP_201_CREATED)
-async def submit_job(
-    request: JobRequest,
-    background_tasks: BackgroundTasks,
-    token: str = "mock_token_test_user",
-):
-    auth_result = await verify_token(token)
-    user_id = auth_result["user_id"]
-
-    instance = db.instances.get(request.instance_id)
+def _check_job_instance(user_id: str, instance_id: str):
+    instance = db.instances.get(instance_id)
     if not instance or instance["user_id"] != user_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -294,9 +565,11 @@ async def submit_job(
             detail=f"Instance is not active. Current status: {instance['status']}",
         )
 
+
+def _start_job(user_id: str, request: JobRequest) -> str:
     job_id = f"job_{uuid.uuid4().hex[:8]}"
 
-    db.jobs[job_id] = {
+    db.add_job({
         "id": job_id,
         "instance_id": request.instance_id,
         "user_id": user_id,
@@ -308,11 +581,21 @@ async def submit_job(
         "duration": 0,
         "gpu_utilization": 0,
         "progress": 0,
-    }
+    })
 
-    background_tasks.add_task(simulate_job_execution, job_id)
+    simulate_job_execution(job_id)
 
     logger.info(f"Job {job_id} submitted to instance {request.instance_id}")
+    return job_id
+
+
+@app.post("/api/v1/jobs", status_code=status.HTTP_201_CREATED)
+async def submit_job(
+    request: JobRequest,
+    user_id: str = Depends(get_user_id),
+):
+    _check_job_instance(user_id, request.instance_id)
+    job_id = _start_job(user_id, request)
 
     return {
         "job_id": job_id,
@@ -322,11 +605,46 @@ async def submit_job(
     }
 
 
-@app.get("/api/v1/jobs/{job_id}")
-async def get_job(job_id: str, token: str = "mock_token_test_user"):
-    auth_result = await verify_token(token)
-    user_id = auth_result["user_id"]
+@app.post("/api/v1/jobs/batch", status_code=status.HTTP_201_CREATED)
+async def submit_jobs_batch(
+    request: JobBatchRequest,
+    user_id: str = Depends(get_user_id),
+):
+    # All-or-nothing: every target instance is checked before any job starts
+    for instance_id in {job.instance_id for job in request.jobs}:
+        _check_job_instance(user_id, instance_id)
+    job_ids = [_start_job(user_id, job) for job in request.jobs]
+
+    return {
+        "count": len(job_ids),
+        "jobs": [{"job_id": job_id, "status": "queued"} for job_id in job_ids],
+        "message": "Jobs submitted successfully",
+        "estimated_start": "10 seconds",
+    }
 
+
+@app.get("/api/v1/jobs")
+async def list_jobs(
+    user_id: str = Depends(get_user_id),
+    ids: Optional[str] = None,
+):
+    # ?ids=a,b,c reads just those jobs; unknown or foreign ids are left out
+    if ids:
+        candidates = (db.jobs.get(job_id) for job_id in ids.split(","))
+    else:
+        candidates = db.jobs.values()
+    jobs = [job for job in candidates if job is not None and job["user_id"] == user_id]
+
+    return {"jobs": jobs, "count": len(jobs)}
+
+
+@app.get("/api/v1/jobs/{job_id}")
+async def get_job(
+    job_id: str,
+    user_id: str = Depends(get_user_id),
+    wait_for: Optional[str] = None,
+    timeout: float = Query(default=30, ge=0, le=LONG_POLL_MAX),
+):
     job = db.jobs.get(job_id)
 
     if not job or job["user_id"] != user_id:
@@ -335,46 +653,86 @@ async def get_job(job_id: str, token: str = "mock_token_test_user"):
             detail="Job not found or access denied",
         )
 
-    if job["status"] == "running":
-        elapsed = time.time() - job["submitted_at"]
-        job["progress"] = min(95, (elapsed / 30) * 100)
+    await wait_for_status(job, wait_for, timeout, final=("completed", "failed"))
 
     return job
 
 
+async def _job_events(job: dict):
+    # Server-sent events: one per status or progress change, ending once the job finishes
+    last = None
+    while True:
+        event = {"job_id": job["id"], "status": job["status"], "progress": job.get("progress", 0)}
+        if event != last:
+            last = event
+            yield f"data: {json.dumps(event)}\n\n"
+            if event["status"] in ("completed", "failed"):
+                return
+        await asyncio.sleep(TICK_INTERVAL)
+
+
+@app.get("/api/v1/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    user_id: str = Depends(get_user_id),
+):
+    job = db.jobs.get(job_id)
+
+    if not job or job["user_id"] != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or access denied",
+        )
+
+    return StreamingResponse(
+        _job_events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @app.get("/api/v1/metrics")
 async def get_metrics(
     instance_id: Optional[str] = None,
     metric_type: Optional[str] = None,
     minutes: int = 30,
 ):
-    metrics = []
     target_instances = [instance_id] if instance_id else list(db.instances.keys())
+    target_instances = [i for i in target_instances if i in db.instances]
+
+    n = 0
+    if target_instances and (not metric_type or metric_type in _METRIC_FIELDS):
+        # Draw every sample in one vectorized call per field; samples share a timestamp
+        n = len(target_instances) * _SAMPLES_PER_INSTANCE
+        db.metrics.extend(
+            time.time(),
+            np.repeat(target_instances, _SAMPLES_PER_INSTANCE),
+            _RNG.uniform(10, 99, n),
+            _RNG.integers(1024, 4096, n, endpoint=True),
+            _RNG.uniform(250, 400, n),
+            _RNG.uniform(40, 85, n),
+        )
 
-    for inst_id in target_instances:
-        if inst_id in db.instances:
-            for _ in range(10):
-                metric = db.generate_metrics(inst_id)
-                if metric_type and metric_type not in metric:
-                    continue
-                metrics.append(metric)
-                db.metrics.append(metric)
-
-    return {
-        "count": len(metrics),
-        "metrics": metrics[-100:],
+    return ORJSONResponse({
+        "count": n,
+        "metrics": db.metrics.to_dicts(min(n, 100)),
         "time_range": f"last {minutes} minutes",
-    }
+    })
+
+
+async def _finalize_delete(instance_id: str):
+    await asyncio.sleep(2)
+    if instance_id in db.instances:
+        db.remove_instance(instance_id)
+        logger.info(f"Instance {instance_id} terminated")
 
 
 @app.delete("/api/v1/gpu/instances/{instance_id}")
 async def delete_instance(
     instance_id: str,
-    token: str = "mock_token_test_user",
+    background_tasks: BackgroundTasks,
+    user_id: str = Depends(get_user_id),
 ):
-    auth_result = await verify_token(token)
-    user_id = auth_result["user_id"]
-
     instance = db.instances.get(instance_id)
 
     if not instance or instance["user_id"] != user_id:
@@ -384,8 +742,8 @@ async def delete_instance(
         )
 
     running_jobs = [
-        j for j in db.jobs.values()
-        if j["instance_id"] == instance_id and j["status"] in ["running", "queued"]
+        j for j in db.jobs_by_instance.get(instance_id, {}).values()
+        if j["status"] in ["running", "queued"]
     ]
 
     if running_jobs:
@@ -396,11 +754,8 @@ async def delete_instance(
 
     instance["status"] = "terminating"
 
-    await asyncio.sleep(2)
-
-    del db.instances[instance_id]
-
-    logger.info(f"Instance {instance_id} terminated")
+    # Teardown finishes after the response has been sent
+    background_tasks.add_task(_finalize_delete, instance_id)
 
     return {
         "message": "Instance terminated successfully",
@@ -408,41 +763,95 @@ async def delete_instance(
     }
 
 
-@app.get("/health")
-async def health_check():
+async def _batch_dispatch(sub: BatchSubRequest, headers: Dict[str, str]) -> dict:
+    response = await app.state.batch_client.request(sub.method, sub.url, headers=headers)
     return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "mock-gpuas-server",
-        "version": "1.0.0",
-        "statistics": {
-            "users": len(db.users),
-            "instances": len(db.instances),
-            "jobs": len(db.jobs),
-            "metrics": len(db.metrics),
-        },
+        "url": sub.url,
+        "status": response.status_code,
+        "body": response.json() if response.content else None,
     }
 
 
+@app.post("/api/v1/batch")
+async def batch(
+    request: BatchRequest,
+    authorization: Optional[str] = Header(default=None),
+):
+    if any(sub.url.startswith("/api/v1/batch") for sub in request.requests):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Batch requests cannot be nested",
+        )
+
+    headers = {"Authorization": authorization} if authorization else {}
+    responses = await asyncio.gather(
+        *(_batch_dispatch(sub, headers) for sub in request.requests)
+    )
+    return ORJSONResponse({"responses": list(responses)})
+
+
+# (monotonic expiry, body) of the last health response; probes within the TTL reuse it
+_HEALTH_TTL = 1.0
+_health_cache = (0.0, None)
+
+
+def _health_body():
+    global _health_cache
+    now = time.monotonic()
+    expires, body = _health_cache
+    if body is None or now >= expires:
+        body = {
+            "status": "healthy",
+            "timestamp": datetime.now(),
+            "service": "mock-gpuas-server",
+            "version": "1.0.0",
+            "statistics": {
+                "users": len(db.users),
+                "instances": len(db.instances),
+                "jobs": len(db.jobs),
+                "metrics": len(db.metrics),
+            },
+        }
+        _health_cache = (now + _HEALTH_TTL, body)
+    return body
+
+
+@app.get("/health")
+async def health_check():
+    return ORJSONResponse(_health_body())
+
+
+# The root listing never changes, so it is built once at import
+_ROOT_BODY = {
+    "message": "Mock GPUaaS Platform API",
+    "version": "1.0.0",
+    "documentation": "/docs",
+    "endpoints": {
+        "auth": ["POST /api/v1/auth/login", "GET /api/v1/auth/verify"],
+        "instances": [
+            "POST /api/v1/gpu/instances",
+            "POST /api/v1/gpu/instances/batch",
+            "GET /api/v1/gpu/instances",
+            "GET /api/v1/gpu/instances/{id}",
+            "DELETE /api/v1/gpu/instances/{id}",
+        ],
+        "jobs": [
+            "POST /api/v1/jobs",
+            "POST /api/v1/jobs/batch",
+            "GET /api/v1/jobs",
+            "GET /api/v1/jobs/{id}",
+            "GET /api/v1/jobs/{id}/events",
+        ],
+        "metrics": ["GET /api/v1/metrics"],
+        "health": ["GET /health"],
+        "batch": ["POST /api/v1/batch"],
+    },
+}
+
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Mock GPUaaS Platform API",
-        "version": "1.0.0",
-        "documentation": "/docs",
-        "endpoints": {
-            "auth": ["POST /api/v1/auth/login", "GET /api/v1/auth/verify"],
-            "instances": [
-                "POST /api/v1/gpu/instances",
-                "GET /api/v1/gpu/instances",
-                "GET /api/v1/gpu/instances/{id}",
-                "DELETE /api/v1/gpu/instances/{id}",
-            ],
-            "jobs": ["POST /api/v1/jobs", "GET /api/v1/jobs/{id}"],
-            "metrics": ["GET /api/v1/metrics"],
-            "health": ["GET /health"],
-        },
-    }
+    return _ROOT_BODY
 
 
 if __name__ == "__main__":
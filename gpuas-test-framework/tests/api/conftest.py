@@ -0,0 +1,114 @@
+import concurrent.futures
+import threading
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.api_client import APIError, GPUaaSClient
+from core.assertions import CustomAssertions
+from utils.logger import logger
+
+
+@pytest.fixture(scope="session")
+def shared_session():
+    """One pooled HTTP session reused by API clients across threads and tests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    yield session
+
+    session.close()
+
+
+def _instance_gone(client, instance_id):
+    try:
+        client.get_instance(instance_id)
+    except APIError as exc:
+        return "404" in str(exc) or "not found" in str(exc).lower()
+    return False
+
+
+class _DeleteQueue:
+    """Background pool that deletes test instances while later tests keep running."""
+
+    def __init__(self, max_workers: int = 10):
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cleanup"
+        )
+        # requests.Session is not thread-safe, so each worker logs in with its own client
+        self._local = threading.local()
+        self._clients = []
+        self._futures = set()
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = GPUaaSClient()
+            client.login()
+            self._local.client = client
+            self._clients.append(client)
+        return client
+
+    def _delete(self, instance_id):
+        try:
+            client = self._client()
+            instance = client.get_instance(instance_id)
+            if instance.get("status") in ["active", "provisioning"]:
+                client.delete_instance(instance_id)
+                logger.info(f"Cleaned up instance: {instance_id}")
+            elif instance.get("status") != "terminating":
+                return
+            # The server frees the GPU quota only once the instance is actually gone
+            CustomAssertions.assert_eventually(
+                lambda: _instance_gone(client, instance_id),
+                timeout=10,
+                interval=1,
+                error_msg=f"Instance {instance_id} still present after cleanup",
+            )
+        except (APIError, AssertionError) as exc:
+            logger.warning(f"Failed to cleanup instance {instance_id}: {exc}")
+
+    def submit(self, instance_id):
+        future = self._executor.submit(self._delete, instance_id)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+
+    def drain(self):
+        """Block until every queued delete has finished and freed its quota."""
+        concurrent.futures.wait(list(self._futures))
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for client in self._clients:
+            client.session.close()
+
+
+@pytest.fixture(scope="session")
+def _pending_deletes():
+    """Session-wide delete queue; outstanding deletes finish before the session ends."""
+    # 10 workers bounds load on the API
+    queue = _DeleteQueue(max_workers=10)
+
+    yield queue
+
+    queue.close()
+
+
+@pytest.fixture(autouse=True)
+def _drain_for_quota(request):
+    # Tests marked @pytest.mark.quota start only after earlier tests' deletes have freed their GPUs
+    if request.node.get_closest_marker("quota") is not None:
+        request.getfixturevalue("_pending_deletes").drain()
+
+
+@pytest.fixture
+def cleanup_instances(_pending_deletes):
+    """Collect instance IDs to delete; teardown queues the deletes instead of waiting on them."""
+    created_instances = []
+    yield created_instances
+
+    for instance_id in created_instances:
+        _pending_deletes.submit(instance_id)
@@ -9,9 +9,9 @@ from utils.logger import logger
 class TestAuthentication:
     """Test authentication endpoints"""
 
-    @pytest.fixture
-    def client(self):
-        return GPUaaSClient()
+    @pytest.fixture(scope="session")
+    def client(self, shared_session):
+        return GPUaaSClient(session=shared_session)
 
     @pytest.mark.smoke
     @pytest.mark.auth
@@ -59,13 +59,16 @@ class TestAuthentication:
     def test_concurrent_logins(self, client):
         TestReporter.log_test_step("Test concurrent logins")
 
-        def single_login():
+        def single_login(_):
+            # login() sets the session's Authorization header, so each thread gets its own session
             temp_client = GPUaaSClient()
-            return temp_client.login()
+            try:
+                return temp_client.login()
+            finally:
+                temp_client.session.close()
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(single_login) for _ in range(5)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+            results = list(executor.map(single_login, range(5)))
 
         assert len(results) == 5
         for result in results:
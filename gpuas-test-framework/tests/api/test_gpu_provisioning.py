@@ -1,41 +1,23 @@
 import time
 import pytest
-from core.api_client import GPUaaSClient, APIError
+from core.api_client import APIError
 from core.assertions import CustomAssertions
 from core.reporting import TestReporter
-from config.test_data import GPUInstanceFactory
 from utils.logger import logger
 
 
 class TestGPUProvisioning:
     """Test GPU instance provisioning"""
 
-    @pytest.fixture
-    def authenticated_client(self):
-        client = GPUaaSClient()
-        client.login()
-        return client
-
-    @pytest.fixture
-    def cleanup_instances(self, authenticated_client):
-        created_instances = []
-        yield created_instances
-
-        for instance_id in created_instances:
-            try:
-                instance = authenticated_client.get_instance(instance_id)
-                if instance.get("status") in ["active", "provisioning"]:
-                    authenticated_client.delete_instance(instance_id)
-                    logger.info(f"Cleaned up instance: {instance_id}")
-                    time.sleep(2)
-            except APIError as exc:
-                logger.warning(f"Failed to cleanup instance {instance_id}: {exc}")
-
     @pytest.mark.smoke
     @pytest.mark.provisioning
+    @pytest.mark.quota
     def test_create_gpu_instance(self, authenticated_client, cleanup_instances):
         TestReporter.log_test_step("Test create GPU instance")
 
+        # Imported here so collecting the suite does not load factory_boy
+        from config.test_data import GPUInstanceFactory
+
         test_data = GPUInstanceFactory.create_training_instance()
 
         response = authenticated_client.create_gpu_instance(**test_data)
@@ -67,31 +49,27 @@ class TestGPUProvisioning:
         logger.info(f"GPU instance created successfully: {instance_id}")
 
     @pytest.mark.provisioning
+    @pytest.mark.quota
     def test_create_multiple_gpu_types(self, authenticated_client, cleanup_instances):
         TestReporter.log_test_step("Test multiple GPU types")
 
         gpu_types = ["A100", "H100", "V100", "RTX4090"]
-        created_instances = []
 
-        for gpu_type in gpu_types:
-            response = authenticated_client.create_gpu_instance(
-                gpu_type=gpu_type,
-                count=1,
-                region="us-east-1",
-            )
+        created_instances = authenticated_client.create_gpu_instances_batch(
+            [{"gpu_type": gpu_type, "count": 1, "region": "us-east-1"} for gpu_type in gpu_types]
+        )
+        cleanup_instances.extend(created_instances)
 
-            assert response["status"] == "provisioning"
-            instance_id = response["instance_id"]
-            created_instances.append(instance_id)
-            cleanup_instances.append(instance_id)
+        assert len(created_instances) == len(gpu_types)
 
-            CustomAssertions.assert_instance_state(
-                instance_id,
-                expected_state="active",
-                timeout=45,
-                interval=3,
-            )
+        CustomAssertions.assert_instances_state(
+            created_instances,
+            expected_state="active",
+            timeout=45,
+            interval=3,
+        )
 
+        for gpu_type, instance_id in zip(gpu_types, created_instances):
             instance = authenticated_client.get_instance(instance_id)
             assert instance["gpu_type"] == gpu_type
 
@@ -199,11 +177,19 @@ class TestGPUProvisioning:
         assert delete_response["message"] is not None
         assert "Instance terminated successfully" in delete_response["message"]
 
-        time.sleep(3)
-
-        with pytest.raises(APIError) as exc_info:
-            authenticated_client.get_instance(instance_id)
-
-        assert "404" in str(exc_info.value) or "not found" in str(exc_info.value).lower()
+        # Deletion completes in the background, so poll until the instance is gone
+        def instance_gone():
+            try:
+                authenticated_client.get_instance(instance_id)
+            except APIError as exc:
+                return "404" in str(exc) or "not found" in str(exc).lower()
+            return False
+
+        CustomAssertions.assert_eventually(
+            instance_gone,
+            timeout=10,
+            interval=1,
+            error_msg=f"Instance {instance_id} still present after deletion",
+        )
 
         logger.info(f"Instance {instance_id} successfully deleted")
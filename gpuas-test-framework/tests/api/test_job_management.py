@@ -1,21 +1,12 @@
-import time
 import pytest
-from core.api_client import GPUaaSClient
 from core.assertions import CustomAssertions
 from core.reporting import TestReporter
-from config.test_data import JobFactory
 from utils.logger import logger
 
 
 class TestJobManagement:
     """Test job submission and management"""
 
-    @pytest.fixture
-    def authenticated_client(self):
-        client = GPUaaSClient()
-        client.login()
-        return client
-
     @pytest.fixture
     def setup_instance(self, authenticated_client, cleanup_instances):
         response = authenticated_client.create_gpu_instance(
@@ -31,20 +22,6 @@ class TestJobManagement:
 
         yield instance_id
 
-    @pytest.fixture
-    def cleanup_instances(self, authenticated_client):
-        created_instances = []
-        yield created_instances
-
-        for instance_id in created_instances:
-            try:
-                instance = authenticated_client.get_instance(instance_id)
-                if instance.get("status") in ["active", "provisioning"]:
-                    authenticated_client.delete_instance(instance_id)
-                    logger.info(f"Cleaned up instance: {instance_id}")
-            except Exception as exc:
-                logger.warning(f"Failed to cleanup instance {instance_id}: {exc}")
-
     @pytest.mark.smoke
     @pytest.mark.jobs
     def test_submit_job(self, authenticated_client, setup_instance):
@@ -84,6 +61,9 @@ class TestJobManagement:
             timeout=30,
             interval=3,
             error_msg=f"Job {job_id} did not start running",
+            long_poll=lambda remaining: authenticated_client.wait_for_job_state(
+                job_id, "running", remaining
+            ).get("status") == "running",
         )
 
         job_details = authenticated_client.get_job(job_id)
@@ -129,25 +109,24 @@ class TestJobManagement:
 
         instance_id = setup_instance
         num_jobs = 3
-        job_ids = []
 
-        for i in range(num_jobs):
-            response = authenticated_client.submit_job(
-                instance_id=instance_id,
-                job_type="inference" if i % 2 == 0 else "training",
-                script_path=f"/scripts/job_{i}.py",
-                parameters={"job_index": i},
-            )
-            job_ids.append(response["job_id"])
+        job_ids = authenticated_client.submit_jobs_batch([
+            {
+                "instance_id": instance_id,
+                "job_type": "inference" if i % 2 == 0 else "training",
+                "script_path": f"/scripts/job_{i}.py",
+                "parameters": {"job_index": i},
+            }
+            for i in range(num_jobs)
+        ])
 
         logger.info(f"Submitted {num_jobs} jobs: {job_ids}")
 
-        for job_id in job_ids:
-            CustomAssertions.assert_job_completed(job_id, timeout=180, interval=15)
+        CustomAssertions.assert_jobs_completed(job_ids, timeout=180, interval=15)
 
-        for job_id in job_ids:
-            job_details = authenticated_client.get_job(job_id)
-            assert job_details["status"] in ["completed", "failed"]
+        jobs = authenticated_client.list_jobs(ids=job_ids)["jobs"]
+        assert len(jobs) == num_jobs
+        assert all(job["status"] in ["completed", "failed"] for job in jobs)
 
         logger.info(f"All {num_jobs} concurrent jobs completed")
 
@@ -178,16 +157,13 @@ class TestJobManagement:
 
         progress_values = []
 
-        for _ in range(10):
-            time.sleep(5)
-            job_info = authenticated_client.get_job(job_id)
-
-            if job_info["status"] == "running":
-                progress = job_info.get("progress", 0)
+        for event in authenticated_client.stream_job_events(job_id, timeout=50):
+            if event["status"] == "running":
+                progress = event.get("progress", 0)
                 progress_values.append(progress)
                 logger.debug(f"Job progress: {progress}%")
 
-            if job_info["status"] in ["completed", "failed"]:
+            if event["status"] in ["completed", "failed"]:
                 break
 
         if progress_values:
@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+# Re-login once the shared client's token is this old (seconds)
+LOGIN_TTL = 15 * 60
+
+
+@pytest.fixture(scope="session")
+def _session_client():
+    from core.api_client import GPUaaSClient
+
+    client = GPUaaSClient()
+    client.login()
+    client.login_time = time.monotonic()
+
+    yield client
+
+    client.session.close()
+
+
+@pytest.fixture
+def authenticated_client(_session_client):
+    if time.monotonic() - _session_client.login_time > LOGIN_TTL:
+        _session_client.login()
+        _session_client.login_time = time.monotonic()
+    return _session_client
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose each phase's report to fixtures as item.rep_setup / rep_call / rep_teardown."""
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
@@ -0,0 +1,138 @@
+import time
+from functools import partialmethod
+
+import httpx
+from locust import User
+from locust.exception import CatchResponseError, LocustError, StopTest
+
+from config.settings import settings
+
+try:
+    import h2  # noqa: F401 - httpx only negotiates HTTP/2 when h2 is installed
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 is optional
+    HTTP2_AVAILABLE = False
+
+
+class HttpxResponse:
+    """httpx response that can be marked as success or failure inside a with-block."""
+
+    def __init__(self, response, request_meta, request_event, catch_response):
+        self.response = response
+        self.request_meta = request_meta
+        self._request_event = request_event
+        self._catch_response = catch_response
+        self._result = None
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code if self.response is not None else 0
+
+    @property
+    def headers(self):
+        return self.response.headers if self.response is not None else httpx.Headers()
+
+    @property
+    def content(self) -> bytes:
+        return self.response.content if self.response is not None else b""
+
+    @property
+    def text(self) -> str:
+        return self.response.text if self.response is not None else ""
+
+    def json(self):
+        if self.response is None:
+            raise self.request_meta["exception"]
+        return self.response.json()
+
+    def success(self):
+        self._result = True
+
+    def failure(self, exc):
+        if not isinstance(exc, Exception):
+            exc = CatchResponseError(exc)
+        self._result = exc
+
+    def _report(self):
+        if self._result is True:
+            self.request_meta["exception"] = None
+        elif isinstance(self._result, Exception):
+            self.request_meta["exception"] = self._result
+        self._request_event.fire(**self.request_meta)
+
+    def __enter__(self):
+        if not self._catch_response:
+            raise LocustError("In order to use a with-block for requests, you must also pass catch_response=True")
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc is not None and self._result is None:
+            self.failure(exc)
+        self._report()
+        return exc is None or isinstance(exc, CatchResponseError)
+
+
+class HttpxSession:
+    """httpx.Client that reports every request to Locust's statistics."""
+
+    def __init__(self, base_url: str, user: User):
+        self.user = user
+        self.request_event = user.environment.events.request
+        self.client = httpx.Client(
+            base_url=base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(settings.TEST_TIMEOUT, connect=settings.WAIT_TIMEOUT),
+            headers={"Accept": "application/json"},
+        )
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.client.headers
+
+    def request(self, method: str, url: str, name: str = None, catch_response: bool = False, **kwargs):
+        start_time = time.time()
+        start_perf_counter = time.perf_counter()
+        response, exception = None, None
+        try:
+            response = self.client.request(method, url, **kwargs)
+            if response.is_error:
+                exception = CatchResponseError(f"{response.status_code} {response.reason_phrase}")
+        except httpx.HTTPError as exc:
+            exception = exc
+
+        request_meta = {
+            "request_type": method,
+            "response_time": (time.perf_counter() - start_perf_counter) * 1000,
+            "name": name or url,
+            "context": self.user.context(),
+            "response": response,
+            "response_length": len(response.content) if response is not None else 0,
+            "exception": exception,
+            "start_time": start_time,
+            "url": str(response.url) if response is not None else url,
+        }
+
+        wrapped = HttpxResponse(response, request_meta, self.request_event, catch_response)
+        if not catch_response:
+            wrapped._report()
+        return wrapped
+
+    get = partialmethod(request, "GET")
+    post = partialmethod(request, "POST")
+    put = partialmethod(request, "PUT")
+    delete = partialmethod(request, "DELETE")
+
+    def close(self):
+        self.client.close()
+
+
+class HttpxUser(User):
+    """Locust user whose client multiplexes requests over HTTP/2 when the server supports it."""
+
+    abstract = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.host is None:
+            raise StopTest("You must specify the base host, either on the User class or with --host.")
+        self.client = HttpxSession(self.host, user=self)
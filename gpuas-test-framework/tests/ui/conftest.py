@@ -1,9 +1,27 @@
 import pytest
 import allure
 from playwright.sync_api import Page, BrowserContext
+from config.settings import settings
 from core.reporting import TestReporter
 from utils.logger import logger
 
+_CONTEXT_OPTIONS = {"viewport": {'width': 1920, 'height': 1080}, "base_url": settings.UI_URL}
+
+
+@pytest.fixture(scope="session")
+def authed_state(browser):
+    """Log in through the UI once; tests start from a copy of the resulting cookies and storage."""
+    from .pages.login_page import LoginPage
+
+    context = browser.new_context(**_CONTEXT_OPTIONS)
+    try:
+        login_page = LoginPage(context.new_page())
+        login_page.navigate().login(settings.TEST_USER, settings.TEST_PASSWORD)
+        login_page.expect_successful_login()
+        return context.storage_state()
+    finally:
+        context.close()
+
 
 @pytest.fixture(scope="function")
 def page(context: BrowserContext):
@@ -20,28 +38,41 @@ def page(context: BrowserContext):
 
 
 @pytest.fixture(scope="function")
-def context(browser):
-    context = browser.new_context(
-        viewport={'width': 1920, 'height': 1080},
-        record_video_dir="reports/videos/",
-        record_har_path="reports/har/",
+def context(browser, request):
+    # Full capture (video, HAR, trace snapshots) only runs for tests marked
+    # @pytest.mark.record, or when pytest-rerunfailures (--reruns N) retries a failure
+    record = (
+        request.node.get_closest_marker("record") is not None
+        or getattr(request.node, "execution_count", 1) > 1
     )
+    options = dict(_CONTEXT_OPTIONS)
+    # Tests marked @pytest.mark.anonymous start logged out; the rest reuse the session login
+    if request.node.get_closest_marker("anonymous") is None:
+        options["storage_state"] = request.getfixturevalue("authed_state")
+    if record:
+        options.update(record_video_dir="reports/videos/", record_har_path="reports/har/")
 
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
+    context = browser.new_context(**options)
 
-    yield context
+    context.tracing.start(screenshots=record, snapshots=record, sources=record)
 
-    trace_path = "reports/trace.zip"
-    context.tracing.stop(path=trace_path)
+    yield context
 
-    try:
-        allure.attach.file(
-            trace_path,
-            name="playwright_trace",
-            attachment_type=allure.attachment_type.ZIP,
-        )
-    except Exception as exc:
-        logger.error(f"Failed to attach trace: {exc}")
+    if record or getattr(pytest, "test_failed", False):
+        trace_path = "reports/trace.zip"
+        context.tracing.stop(path=trace_path)
+
+        try:
+            allure.attach.file(
+                trace_path,
+                name="playwright_trace",
+                attachment_type=allure.attachment_type.ZIP,
+            )
+        except Exception as exc:
+            logger.error("Failed to attach trace: %s", exc)
+    else:
+        # Passing, unrecorded test: drop the trace without writing it out
+        context.tracing.stop()
 
     context.close()
 
@@ -1,5 +1,5 @@
 import time
-from playwright.sync_api import Page, expect
+from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError, expect
 from core.reporting import TestReporter
 from utils.logger import logger
 
@@ -7,6 +7,38 @@ from utils.logger import logger
 class DashboardPage:
     """Page Object for Dashboard page"""
 
+    # Instance rows are read in the browser in one round trip instead of one query per cell
+    _ROW_EVAL_JS = """row => {
+        const cell = cls => row.querySelector(`td.${cls}`)?.textContent ?? null;
+        return {
+            name: cell("name"),
+            gpu_type: cell("gpu-type"),
+            count: parseInt(cell("count"), 10),
+            status: cell("status"),
+            region: cell("region"),
+        };
+    }"""
+    _FIND_ROW_JS = (
+        "(rows, name) => rows.findIndex("
+        'r => (r.querySelector("td.name")?.textContent ?? "").includes(name))'
+    )
+    _HAS_ROW_JS = (
+        "name => [...document.querySelectorAll('table.instances tbody tr td.name')]"
+        ".some(td => td.textContent.includes(name))"
+    )
+    _HAS_ROWS_JS = (
+        "names => { const cells = [...document.querySelectorAll('table.instances tbody tr td.name')];"
+        " return names.every(name => cells.some(td => td.textContent.includes(name))); }"
+    )
+    _ROWS_EVAL_JS = f"rows => rows.map({_ROW_EVAL_JS})"
+    _ROW_BY_NAME_JS = (
+        f"(rows, name) => {{ const i = ({_FIND_ROW_JS})(rows, name);"
+        f" return i < 0 ? null : ({_ROW_EVAL_JS})(rows[i]); }}"
+    )
+
+    # How long to let the table update in place before falling back to a reload
+    _LIVE_UPDATE_WAIT_MS = 10000
+
     def __init__(self, page: Page):
         self.page = page
         self.welcome_message = page.locator(".welcome-message")
@@ -26,6 +58,15 @@ class DashboardPage:
         self.submit_instance_button = page.locator("button#submit-instance")
         self.cancel_button = page.locator("button#cancel-instance")
 
+        # Set once the dashboard has rendered; any main-frame navigation, including
+        # reloads made outside this page object, clears it again
+        self._loaded = False
+        page.on("framenavigated", self._on_navigated)
+
+    def _on_navigated(self, frame):
+        if frame == self.page.main_frame:
+            self._loaded = False
+
     def navigate(self):
         self.page.goto("/dashboard")
         self._wait_for_loading()
@@ -33,8 +74,13 @@ class DashboardPage:
         return self
 
     def _wait_for_loading(self, timeout: int = 10000):
+        # Nothing has navigated since the last wait, so a one-shot check is enough
+        if self._loaded and self.welcome_message.is_visible() and self.gpu_instances_section.is_visible():
+            return
+
         expect(self.welcome_message).to_be_visible(timeout=timeout)
         expect(self.gpu_instances_section).to_be_visible(timeout=timeout)
+        self._loaded = True
 
     def get_welcome_text(self) -> str:
         return self.welcome_message.text_content()
@@ -73,61 +119,72 @@ class DashboardPage:
 
         expect(self.instance_modal).to_be_hidden()
 
-        logger.info(f"UI instance creation submitted: {config}")
+        logger.info("UI instance creation submitted: %s", config)
         return config["name"]
 
+    def _wait_in_page(self, expression: str, arg, timeout: int) -> bool:
+        """Poll expression in the browser until it is truthy or timeout (ms) runs out."""
+        deadline = time.monotonic() + timeout / 1000
+        while True:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0:
+                return False
+
+            # The browser polls its own DOM; a reload is only needed if the table
+            # does not update in place
+            try:
+                self.page.wait_for_function(
+                    expression,
+                    arg=arg,
+                    timeout=min(remaining_ms, self._LIVE_UPDATE_WAIT_MS),
+                    polling=500,
+                )
+                return True
+            except PlaywrightTimeoutError:
+                self.page.reload()
+                self._wait_for_loading()
+
     def wait_for_instance_creation(self, instance_name: str, timeout: int = 60000):
         TestReporter.log_test_step(f"Wait for instance {instance_name}")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout / 1000:
-            instances = self.get_instance_details()
-            for instance in instances:
-                if instance_name in instance.get("name", ""):
-                    logger.info(f"Instance found: {instance_name}")
-                    return instance
+        instance = None
+        if self._wait_in_page(self._HAS_ROW_JS, instance_name, timeout):
+            instance = self.get_instance_by_name(instance_name)
+        if not instance:
+            raise TimeoutError(f"Instance {instance_name} not found within {timeout}ms")
 
-            time.sleep(2)
-            self.page.reload()
-            self._wait_for_loading()
+        logger.info("Instance found: %s", instance_name)
+        return instance
 
-        raise TimeoutError(f"Instance {instance_name} not found within {timeout}ms")
+    def wait_for_instances_creation(self, instance_names: list, timeout: int = 60000):
+        TestReporter.log_test_step(f"Wait for {len(instance_names)} instances")
 
-    def get_instance_details(self) -> list:
-        instances = []
+        # One browser-side check covers every name, so the waits overlap instead of queueing
+        if not self._wait_in_page(self._HAS_ROWS_JS, list(instance_names), timeout):
+            raise TimeoutError(f"Instances {instance_names} not all found within {timeout}ms")
 
-        for i in range(self.instance_rows.count()):
-            row = self.instance_rows.nth(i)
-            instance = {
-                "name": row.locator("td.name").text_content(),
-                "gpu_type": row.locator("td.gpu-type").text_content(),
-                "count": int(row.locator("td.count").text_content()),
-                "status": row.locator("td.status").text_content(),
-                "region": row.locator("td.region").text_content(),
-            }
-            instances.append(instance)
+        logger.info("Instances found: %s", instance_names)
+        return [self.get_instance_by_name(name) for name in instance_names]
 
-        return instances
+    def get_instance_row(self, name: str) -> Locator:
+        return self.instance_rows.filter(has=self.page.locator("td.name", has_text=name))
+
+    def get_instance_details(self) -> list:
+        return self.instance_rows.evaluate_all(self._ROWS_EVAL_JS)
 
     def get_instance_by_name(self, name: str):
-        instances = self.get_instance_details()
-        for instance in instances:
-            if name in instance["name"]:
-                return instance
-        return None
+        return self.instance_rows.evaluate_all(self._ROW_BY_NAME_JS, name)
 
     def view_instance_metrics(self, instance_name: str):
         TestReporter.log_test_step(f"View metrics for {instance_name}")
 
-        for i in range(self.instance_rows.count()):
-            row = self.instance_rows.nth(i)
-            if instance_name in row.locator("td.name").text_content():
-                row.locator("button.metrics").click()
-                break
+        index = self.instance_rows.evaluate_all(self._FIND_ROW_JS, instance_name)
+        if index >= 0:
+            self.instance_rows.nth(index).locator("button.metrics").click()
 
         expect(self.metrics_chart).to_be_visible()
 
-        logger.info(f"Metrics opened for instance: {instance_name}")
+        logger.info("Metrics opened for instance: %s", instance_name)
         return self
 
     def logout(self):
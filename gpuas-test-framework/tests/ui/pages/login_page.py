@@ -1,4 +1,6 @@
-from playwright.sync_api import Page, expect
+from functools import cached_property
+
+from playwright.sync_api import Locator, Page, expect
 from core.reporting import TestReporter
 from utils.logger import logger
 
@@ -6,13 +8,53 @@ from utils.logger import logger
 class LoginPage:
     """Page Object for Login page"""
 
+    _USERNAME_SEL = "input[name='username']"
+    _PASSWORD_SEL = "input[name='password']"
+    _LOGIN_BUTTON_SEL = "button[type='submit']"
+    _ERROR_MESSAGE_SEL = ".error-message"
+    _FORGOT_PASSWORD_SEL = "a[href='/forgot-password']"
+
+    # Fills both fields and submits in one browser call. The native value setter keeps
+    # framework-controlled inputs in sync; until the form has rendered it returns false,
+    # so wait_for_function keeps polling like fill() would
+    _LOGIN_JS = """([userSel, passSel, buttonSel, username, password]) => {
+        const user = document.querySelector(userSel);
+        const pass = document.querySelector(passSel);
+        const button = document.querySelector(buttonSel);
+        if (!user || !pass || !button) return false;
+        const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+        for (const [input, value] of [[user, username], [pass, password]]) {
+            setValue.call(input, value);
+            input.dispatchEvent(new Event("input", { bubbles: true }));
+            input.dispatchEvent(new Event("change", { bubbles: true }));
+        }
+        button.click();
+        return true;
+    }"""
+
     def __init__(self, page: Page):
         self.page = page
-        self.username_input = page.locator("input[name='username']")
-        self.password_input = page.locator("input[name='password']")
-        self.login_button = page.locator("button[type='submit']")
-        self.error_message = page.locator(".error-message")
-        self.forgot_password_link = page.locator("a[href='/forgot-password']")
+
+    # Locators are built on first use; most tests never touch the error or reset elements
+    @cached_property
+    def username_input(self) -> Locator:
+        return self.page.locator(self._USERNAME_SEL)
+
+    @cached_property
+    def password_input(self) -> Locator:
+        return self.page.locator(self._PASSWORD_SEL)
+
+    @cached_property
+    def login_button(self) -> Locator:
+        return self.page.locator(self._LOGIN_BUTTON_SEL)
+
+    @cached_property
+    def error_message(self) -> Locator:
+        return self.page.locator(self._ERROR_MESSAGE_SEL)
+
+    @cached_property
+    def forgot_password_link(self) -> Locator:
+        return self.page.locator(self._FORGOT_PASSWORD_SEL)
 
     def navigate(self):
         self.page.goto("/login")
@@ -22,11 +64,12 @@ class LoginPage:
     def login(self, username: str, password: str):
         TestReporter.log_test_step(f"Login as {username}")
 
-        self.username_input.fill(username)
-        self.password_input.fill(password)
-        self.login_button.click()
+        self.page.wait_for_function(
+            self._LOGIN_JS,
+            arg=[self._USERNAME_SEL, self._PASSWORD_SEL, self._LOGIN_BUTTON_SEL, username, password],
+        )
 
-        logger.info(f"Login attempted for user: {username}")
+        logger.info("Login attempted for user: %s", username)
         return self
 
     def expect_successful_login(self):
@@ -37,7 +80,7 @@ class LoginPage:
         expect(self.error_message).to_be_visible()
         if message:
             expect(self.error_message).to_contain_text(message)
-        logger.info(f"Login error displayed: {message or 'generic error'}")
+        logger.info("Login error displayed: %s", message or "generic error")
 
     def click_forgot_password(self):
         self.forgot_password_link.click()
@@ -1,6 +1,8 @@
+import concurrent.futures
 import time
 import pytest
 from playwright.sync_api import expect
+from core.assertions import CustomAssertions
 from core.reporting import TestReporter
 from utils.logger import logger
 
@@ -18,26 +20,31 @@ class TestUIWorkflows:
 
         yield
 
-        for instance_id in self.test_instances:
-            try:
-                self.api_client.delete_instance(instance_id)
-                logger.info(f"Cleaned up instance via API: {instance_id}")
-            except Exception as exc:
-                logger.warning(f"Failed to cleanup instance {instance_id}: {exc}")
+        if not self.test_instances:
+            return
+
+        # Deletes are independent round trips, so overlap them
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(self.test_instances))) as executor:
+            futures = {
+                executor.submit(self.api_client.delete_instance, instance_id): instance_id
+                for instance_id in self.test_instances
+            }
+            for future in concurrent.futures.as_completed(futures):
+                instance_id = futures[future]
+                try:
+                    future.result()
+                    logger.debug("Cleaned up instance via API: %s", instance_id)
+                except Exception as exc:
+                    logger.warning("Failed to cleanup instance %s: %s", instance_id, exc)
 
     @pytest.mark.e2e
-    def test_complete_gpu_provisioning_flow(self, login_page, dashboard_page):
+    def test_complete_gpu_provisioning_flow(self, dashboard_page):
         TestReporter.log_test_step("Complete GPU provisioning E2E test")
 
-        login_page.navigate().login("test_user", "test_pass")
-        login_page.expect_successful_login()
-
-        TestReporter.attach_screenshot(self.page, "after_login")
-
         dashboard_page.navigate()
         initial_count = dashboard_page.get_instance_count()
 
-        logger.info(f"Initial instance count: {initial_count}")
+        logger.info("Initial instance count: %s", initial_count)
 
         instance_name = dashboard_page.open_create_instance_modal().create_gpu_instance(
             gpu_type="A100",
@@ -66,9 +73,10 @@ class TestUIWorkflows:
 
         expect(dashboard_page.metrics_chart).to_be_visible()
 
-        logger.info(f"E2E test completed. Created instance: {instance_name}")
+        logger.info("E2E test completed. Created instance: %s", instance_name)
 
     @pytest.mark.ui
+    @pytest.mark.anonymous
     def test_login_with_invalid_credentials(self, login_page):
         TestReporter.log_test_step("Test invalid login")
 
@@ -83,12 +91,9 @@ class TestUIWorkflows:
         logger.info("Invalid login test passed")
 
     @pytest.mark.ui
-    def test_create_multiple_instances(self, login_page, dashboard_page):
+    def test_create_multiple_instances(self, dashboard_page):
         TestReporter.log_test_step("Test multiple instance creation")
 
-        login_page.navigate().login("test_user", "test_pass")
-        login_page.expect_successful_login()
-
         dashboard_page.navigate()
         initial_count = dashboard_page.get_instance_count()
 
@@ -103,13 +108,26 @@ class TestUIWorkflows:
                 name=f"Multi-Test-{i}-{int(time.time())}",
             )
             created_names.append(instance_name)
-            time.sleep(2)
 
-        for name in created_names:
-            dashboard_page.wait_for_instance_creation(name, timeout=90000)
+        # The creates are submitted back to back so provisioning overlaps on the backend
+        dashboard_page.wait_for_instances_creation(created_names, timeout=90000)
+
+        # Rows show up while still provisioning; wait for every instance to go active via the API
+        instance_ids = {
+            instance.get("instance_name"): instance["id"]
+            for instance in self.api_client.list_instances(use_cache=False)["instances"]
+        }
+        missing = [name for name in created_names if name not in instance_ids]
+        assert not missing, f"Instances {missing} not found via API"
+        CustomAssertions.assert_instances_state(
+            [instance_ids[name] for name in created_names], "active", timeout=90, interval=4
+        )
 
-        final_count = dashboard_page.get_instance_count()
-        assert final_count == initial_count + instances_to_create
+        # One reload so the table reflects the new statuses, then read the rows again
+        self.page.reload()
+        dashboard_page._wait_for_loading()
+
+        expect(dashboard_page.instance_rows).to_have_count(initial_count + instances_to_create)
 
         for i, name in enumerate(created_names):
             instance = dashboard_page.get_instance_by_name(name)
@@ -122,15 +140,12 @@ class TestUIWorkflows:
 
         TestReporter.attach_screenshot(self.page, "multiple_instances_created")
 
-        logger.info(f"Created {instances_to_create} instances: {created_names}")
+        logger.info("Created %s instances: %s", instances_to_create, created_names)
 
     @pytest.mark.ui
-    def test_instance_status_updates(self, login_page, dashboard_page):
+    def test_instance_status_updates(self, dashboard_page):
         TestReporter.log_test_step("Test instance status updates")
 
-        login_page.navigate().login("test_user", "test_pass")
-        login_page.expect_successful_login()
-
         dashboard_page.navigate()
 
         instance_name = dashboard_page.open_create_instance_modal().create_gpu_instance(
@@ -141,22 +156,32 @@ class TestUIWorkflows:
 
         assert instance_info["status"].lower() in ["provisioning", "active"]
 
+        # Poll the API (backing off up to 4s) instead of reloading the page each time
+        instance_id = next(
+            (
+                instance["id"]
+                for instance in self.api_client.list_instances()["instances"]
+                if instance.get("instance_name") == instance_name
+            ),
+            None,
+        )
+        assert instance_id is not None, f"Instance {instance_name} not found via API"
+
+        CustomAssertions.assert_instance_state(instance_id, "active", timeout=30, interval=4)
+
+        # One reload to confirm the dashboard shows the new status
         self.page.reload()
         dashboard_page._wait_for_loading()
 
-        for _ in range(10):
-            instance_info = dashboard_page.get_instance_by_name(instance_name)
-            if instance_info and instance_info["status"].lower() == "active":
-                break
-            time.sleep(3)
-            self.page.reload()
-            dashboard_page._wait_for_loading()
-
-        assert instance_info["status"].lower() == "active"
+        expect(dashboard_page.get_instance_row(instance_name).locator("td.status")).to_have_text(
+            "active", ignore_case=True
+        )
 
-        logger.info(f"Instance status correctly updated to active: {instance_name}")
+        logger.info("Instance status correctly updated to active: %s", instance_name)
 
     @pytest.mark.ui
+    # Logs in for itself: logging out may end the server-side session the shared state uses
+    @pytest.mark.anonymous
     def test_logout_functionality(self, login_page, dashboard_page):
         TestReporter.log_test_step("Test logout")
 
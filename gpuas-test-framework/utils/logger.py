@@ -1,18 +1,77 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from config.settings import settings
 
+# No formatter here uses %(thread)s, %(process)s or %(processName)s; skip looking them up per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches writes in a large buffer, flushing at once only for WARNING and above"""
+
+    buffer_size = 64 * 1024
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def emit(self, record):
+        # StreamHandler.emit flushes after every record; here the buffer fills up
+        # first unless the record needs to reach the disk right away
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# Logger name -> listener writing that logger's file output on a background thread
+_listeners = {}
+
+
+def _stop_listener(name: str):
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _stop_listeners():
+    """Flush queued and buffered records to disk before the interpreter exits"""
+    for name in list(_listeners):
+        _stop_listener(name)
+
 
 def setup_logger(name: str = "gpuas_tests") -> logging.Logger:
     """Setup logger with file and console handlers"""
 
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    # DEBUG records are opt-in (GPUAS_LOG_LEVEL=DEBUG); below the level they are never built.
+    # getLevelName maps registered names to their number and anything else to a string
+    level = logging.getLevelName(settings.LOG_LEVEL)
+    unknown_level = not isinstance(level, int)
+    if unknown_level:
+        level = logging.INFO
+    logger.setLevel(level)
 
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_listener(name)
 
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -23,8 +82,8 @@ def setup_logger(name: str = "gpuas_tests") -> logging.Logger:
     # File handler (detailed)
     log_file = settings.LOG_DIR / f"{name}.log"
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
+    file_handler = BufferedFileHandler(log_file)
+    file_handler.setLevel(level)
     file_handler.setFormatter(detailed_formatter)
 
     # Console handler (simple)
@@ -32,10 +91,20 @@ def setup_logger(name: str = "gpuas_tests") -> logging.Logger:
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
 
+    # Log calls only enqueue records for the file; the listener thread does the writes.
+    # Console output stays synchronous so pytest captures it with the right test
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+
     # Add handlers
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     logger.addHandler(console_handler)
 
+    if unknown_level:
+        logger.warning("Unknown GPUAS_LOG_LEVEL %r, falling back to INFO", settings.LOG_LEVEL)
+
     return logger
 
 
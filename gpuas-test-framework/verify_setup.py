@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 """Verify that the test framework is properly set up"""
+import os
 import sys
-from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 
 
 def check_python():
     version = sys.version_info
     if version.major == 3 and version.minor >= 9:
-        print(f"✅ Python {version.major}.{version.minor}.{version.micro} is supported")
-        return True
-    print(f"❌ Python 3.9+ required, found {version.major}.{version.minor}")
-    return False
+        return True, [f"✅ Python {version.major}.{version.minor}.{version.micro} is supported"]
+    return False, [f"❌ Python 3.9+ required, found {version.major}.{version.minor}"]
 
 
 def check_dependencies():
@@ -24,16 +25,38 @@ def check_dependencies():
         "allure-pytest",
     ]
 
+    lines = []
     all_installed = True
     for package in required:
-        try:
-            __import__(package.replace("-", "_"))
-            print(f"✅ {package} is installed")
-        except ImportError:
-            print(f"❌ {package} is NOT installed")
+        # find_spec only locates the module; importing it would run its top-level code
+        if find_spec(package.replace("-", "_")) is not None:
+            lines.append(f"✅ {package} is installed")
+        else:
+            lines.append(f"❌ {package} is NOT installed")
             all_installed = False
 
-    return all_installed
+    return all_installed, lines
+
+
+def _existing(paths):
+    """Map each existing path to whether it is a directory, listing each parent only once"""
+    by_parent = defaultdict(list)
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        by_parent[parent or "."].append((path, name))
+
+    found = {}
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                # is_dir() reuses the type scandir already read, so no extra stat per entry
+                is_dir = {entry.name: entry.is_dir() for entry in entries}
+        except OSError:
+            # Missing parent: none of its children can exist
+            continue
+        found.update((path, is_dir[name]) for path, name in children if name in is_dir)
+
+    return found
 
 
 def check_directories():
@@ -47,15 +70,17 @@ def check_directories():
         "reports",
     ]
 
+    existing = _existing(required_dirs)
+    lines = []
     all_exist = True
     for dir_path in required_dirs:
-        if Path(dir_path).exists():
-            print(f"✅ Directory {dir_path} exists")
+        if existing.get(dir_path) is True:
+            lines.append(f"✅ Directory {dir_path} exists")
         else:
-            print(f"❌ Directory {dir_path} is missing")
+            lines.append(f"❌ Directory {dir_path} is missing")
             all_exist = False
 
-    return all_exist
+    return all_exist, lines
 
 
 def check_files():
@@ -69,15 +94,17 @@ def check_files():
         "README.md",
     ]
 
+    existing = _existing(required_files)
+    lines = []
     all_exist = True
     for file_path in required_files:
-        if Path(file_path).exists():
-            print(f"✅ File {file_path} exists")
+        if existing.get(file_path) is False:
+            lines.append(f"✅ File {file_path} exists")
         else:
-            print(f"❌ File {file_path} is missing")
+            lines.append(f"❌ File {file_path} is missing")
             all_exist = False
 
-    return all_exist
+    return all_exist, lines
 
 
 def main():
@@ -91,10 +118,18 @@ def main():
         ("Required Files", check_files),
     ]
 
+    # The checks are independent and read-only, so run them together; each returns
+    # (passed, output lines) and the output is printed in check order afterwards
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [(check_name, executor.submit(check_func)) for check_name, check_func in checks]
+
     results = []
-    for check_name, check_func in checks:
+    for check_name, future in futures:
+        passed, lines = future.result()
         print(f"\n📋 {check_name}:")
-        results.append((check_name, check_func()))
+        for line in lines:
+            print(line)
+        results.append((check_name, passed))
 
     print("\n" + "=" * 50)
     print("📊 Verification Summary:")